@@ -1,15 +1,18 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
 import logging
-import subprocess
-from copy import copy
+import os
+import posixpath
+import shutil
 from pathlib import Path
 import numpy as np
 from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy import table
+from astropy.utils import lazyproperty
 import gammapy.utils.time as tu
+from gammapy.utils import parallel as parallel
 from gammapy.utils.pbar import progress_bar
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import Checker
@@ -22,9 +25,31 @@ __all__ = ["DataStore"]
 ALL_IRFS = ["aeff", "edisp", "psf", "bkg", "rad_max"]
 ALL_HDUS = ["events", "gti", "pointing"] + ALL_IRFS
 REQUIRED_IRFS = {
-    "full-enclosure": {"aeff", "edisp", "psf", "bkg"},
-    "point-like": {"aeff", "edisp"},
-    "all-optional": {},
+    "full-enclosure": frozenset({"aeff", "edisp", "psf", "bkg"}),
+    "point-like": frozenset({"aeff", "edisp"}),
+    "all-optional": frozenset(),
+}
+_ALL_IRFS_SET = frozenset(ALL_IRFS)
+
+# HDU_TYPE, HDU_CLASS and HDU_NAME of the HDUs written to the HDU index table
+# by `DataStoreMaker`, for each observation
+_EVENTS_HDU_ROWS = (
+    ("events", "events", "EVENTS"),
+    ("gti", "gti", "GTI"),
+)
+_IRF_HDU_ROWS = (
+    ("aeff", "aeff_2d", "EFFECTIVE AREA"),
+    ("edisp", "edisp_2d", "ENERGY DISPERSION"),
+    ("psf", "psf_3gauss", "POINT SPREAD FUNCTION"),
+    ("bkg", "bkg_3d", "BACKGROUND"),
+)
+
+# header keywords shared by the index tables written by `DataStoreMaker`
+_INDEX_TABLE_META = {
+    "HDUCLASS": "GADF",
+    "HDUDOC": "https://github.com/open-gamma-ray-astro/gamma-astro-data-formats",
+    "HDUVERS": "0.2",
+    "HDUCLAS1": "INDEX",
 }
 
 
@@ -46,7 +71,8 @@ class DataStore:
     hdu_table : `~gammapy.data.HDUIndexTable`
         HDU index table.
     obs_table : `~gammapy.data.ObservationTable`
-        Observation index table.
+        Observation index table. If it is sorted by unique OBS_ID, the table
+        is copied without its column data, which is shared with the input.
 
     Examples
     --------
@@ -81,7 +107,13 @@ class DataStore:
     def __init__(self, hdu_table=None, obs_table=None):
         self.hdu_table = hdu_table
         if obs_table is not None:
-            self.obs_table = table.unique(obs_table, keys="OBS_ID")
+            obs_ids = np.asarray(obs_table["OBS_ID"])
+            # index files are usually sorted and unique already, in that
+            # case skip the sorting and only copy the table structure
+            if np.all(obs_ids[1:] > obs_ids[:-1]):
+                self.obs_table = obs_table.copy(copy_data=False)
+            else:
+                self.obs_table = table.unique(obs_table, keys="OBS_ID")
         else:
             self.obs_table = None
 
@@ -94,10 +126,92 @@ class DataStore:
         except AttributeError:
             return f"<pre>{html.escape(str(self))}</pre>"
 
+    @property
+    def hdu_table(self):
+        """HDU index table as a `~gammapy.data.HDUIndexTable`."""
+        return self._hdu_table
+
+    @hdu_table.setter
+    def hdu_table(self, value):
+        self._hdu_table = value
+        self._hdu_table_cache = {}
+
+    def _get_hdu_table_cached(self, name, func):
+        """Get a value derived from the OBS_ID and HDU_TYPE columns of the HDU table.
+
+        The value is recomputed if rows were added or removed, one of these
+        columns was replaced or the table was reassigned. Values modified in
+        place, e.g. by sorting the table, are not detected, reassign
+        ``hdu_table`` in that case.
+
+        Parameters
+        ----------
+        name : str
+            Cache entry name.
+        func : callable
+            Function computing the value.
+        """
+        columns = self.hdu_table["OBS_ID"], self.hdu_table["HDU_TYPE"]
+
+        cached = self._hdu_table_cache.get(name)
+        if cached is not None:
+            cached_len, cached_columns, value = cached
+            if cached_len == len(self.hdu_table) and all(
+                col is cached_col for col, cached_col in zip(columns, cached_columns)
+            ):
+                return value
+
+        value = func()
+        self._hdu_table_cache[name] = len(self.hdu_table), columns, value
+        return value
+
     @property
     def obs_ids(self):
-        """Return the sorted obs_ids contained in the datastore."""
-        return np.unique(self.hdu_table["OBS_ID"].data)
+        """Return the sorted obs_ids contained in the datastore.
+
+        The returned array is read-only.
+        """
+        return self._get_hdu_table_cached("obs_ids", self._compute_obs_ids)
+
+    def _compute_obs_ids(self):
+        obs_ids = np.asarray(self.hdu_table["OBS_ID"].data)
+
+        # HDU tables are usually sorted by OBS_ID already, avoid sorting then
+        if np.all(obs_ids[1:] >= obs_ids[:-1]):
+            is_first = np.ones(len(obs_ids), dtype=bool)
+            is_first[1:] = obs_ids[1:] != obs_ids[:-1]
+            obs_ids = obs_ids[is_first]
+        else:
+            obs_ids = np.unique(obs_ids)
+
+        obs_ids.flags.writeable = False
+        return obs_ids
+
+    @property
+    def _obs_ids_set(self):
+        """Set of obs_ids, for fast membership tests."""
+        return self._get_hdu_table_cached(
+            "obs_ids_set", lambda: frozenset(self.obs_ids.tolist())
+        )
+
+    @property
+    def _hdu_index_by_obs(self):
+        """HDU table row indices, grouped by OBS_ID and HDU_TYPE.
+
+        Built in a single pass over the HDU table, so that accessing an
+        observation does not require a scan of the table per HDU type.
+        """
+        return self._get_hdu_table_cached(
+            "hdu_index_by_obs", self._compute_hdu_index_by_obs
+        )
+
+    def _compute_hdu_index_by_obs(self):
+        index = {}
+        obs_ids = self.hdu_table["OBS_ID"].data.tolist()
+        hdu_types = [_.strip() for _ in self.hdu_table["HDU_TYPE"]]
+        for idx, (obs_id, hdu_type) in enumerate(zip(obs_ids, hdu_types)):
+            index.setdefault(obs_id, {}).setdefault(hdu_type, []).append(idx)
+        return index
 
     @classmethod
     def from_file(cls, filename, hdu_hdu="HDU_INDEX", hdu_obs="OBS_INDEX"):
@@ -121,11 +235,13 @@ class DataStore:
         """
         filename = make_path(filename)
 
-        hdu_table = HDUIndexTable.read(filename, hdu=hdu_hdu, format="fits")
+        # open the file once for both index tables
+        with fits.open(filename, memmap=False) as hdu_list:
+            hdu_table = HDUIndexTable.read(hdu_list, hdu=hdu_hdu, format="fits")
 
-        obs_table = None
-        if hdu_obs:
-            obs_table = ObservationTable.read(filename, hdu=hdu_obs, format="fits")
+            obs_table = None
+            if hdu_obs:
+                obs_table = ObservationTable.read(hdu_list, hdu=hdu_obs, format="fits")
 
         return cls(hdu_table=hdu_table, obs_table=obs_table)
 
@@ -296,35 +412,30 @@ class DataStore:
             Observation container.
 
         """
-        if obs_id not in self.hdu_table["OBS_ID"]:
+        if obs_id not in self._obs_ids_set:
             raise ValueError(f"OBS_ID = {obs_id} not in HDU index table.")
 
         kwargs = {"obs_id": int(obs_id)}
 
-        # check for the "short forms"
-        if isinstance(required_irf, str):
-            required_irf = REQUIRED_IRFS[required_irf]
-
-        if not set(required_irf).issubset(ALL_IRFS):
-            difference = set(required_irf).difference(ALL_IRFS)
-            raise ValueError(
-                f"{difference} is not a valid hdu key. Choose from: {ALL_IRFS}"
-            )
+        required_irf = self._resolve_required_irf(required_irf)
 
         if require_events:
             required_hdus = {"events", "gti"}.union(required_irf)
         else:
             required_hdus = required_irf
 
+        hdu_index = self._hdu_index_by_obs[obs_id]
+
         missing_hdus = []
         for hdu in ALL_HDUS:
-            hdu_location = self.hdu_table.hdu_location(
-                obs_id=obs_id,
-                hdu_type=hdu,
-                warn_missing=False,
-            )
-            if hdu_location is not None:
-                kwargs[hdu] = hdu_location
+            idx = hdu_index.get(hdu)
+            if idx is not None:
+                if len(idx) > 1:
+                    log.warning(
+                        f"Found multiple HDU matching: OBS_ID = {obs_id}, HDU_TYPE = {hdu}."
+                        " Returning the first entry."
+                    )
+                kwargs[hdu] = self.hdu_table.location_info(idx[0])
             elif hdu in required_hdus:
                 missing_hdus.append(hdu)
 
@@ -334,18 +445,41 @@ class DataStore:
             )
 
         # TODO: right now, gammapy doesn't support using the pointing table of GADF
-        # so we always pass the events location here to be read into a FixedPointingInfo
+        # so the pointing is always read from the events location into a
+        # FixedPointingInfo, which is done by the Observation itself
         if "events" in kwargs:
-            pointing_location = copy(kwargs["events"])
-            pointing_location.hdu_class = "pointing"
-            kwargs["pointing"] = pointing_location
-
-            observation_metadata_location = copy(kwargs["events"])
-            observation_metadata_location.hdu_class = "observation_metadata"
-            kwargs["meta"] = observation_metadata_location
+            kwargs.pop("pointing", None)
 
         return Observation(**kwargs)
 
+    @staticmethod
+    def _resolve_required_irf(required_irf):
+        """Validate the required IRFs and convert them to a frozenset."""
+        # check for the "short forms"
+        if isinstance(required_irf, str):
+            return REQUIRED_IRFS[required_irf]
+
+        # no copy if a frozenset is passed already
+        required_irf = frozenset(required_irf)
+
+        difference = required_irf - _ALL_IRFS_SET
+        if difference:
+            raise ValueError(
+                f"{set(difference)} is not a valid hdu key. Choose from: {ALL_IRFS}"
+            )
+        return required_irf
+
+    @staticmethod
+    def _filter_obs_id(obs_id, obs_id_selection):
+        """Keep the obs_id contained in the selection, preserving their order."""
+        obs_id_array = np.asarray(obs_id)
+        if obs_id_array.dtype.kind in "iuf":
+            return obs_id_array[np.isin(obs_id_array, obs_id_selection)]
+
+        # fall back to a set for e.g. heterogeneous lists
+        obs_id_selection = set(obs_id_selection.tolist())
+        return [_ for _ in obs_id if _ in obs_id_selection]
+
     def get_observations(
         self,
         obs_id=None,
@@ -403,41 +537,112 @@ class DataStore:
         observations : `~gammapy.data.Observations`
             Container holding a list of `~gammapy.data.Observation`.
         """
+        obs_id, obs_id_selection = self._resolve_obs_ids(
+            obs_id=obs_id, selection=selection, skip_missing=skip_missing
+        )
+        obs_list = list(
+            self._iter_observations(
+                obs_id_selection,
+                required_irf=required_irf,
+                require_events=require_events,
+            )
+        )
+        log.info(f"Observations selected: {len(obs_list)} out of {len(obs_id)}.")
+        return Observations(obs_list)
 
+    def iter_observations(
+        self,
+        obs_id=None,
+        skip_missing=False,
+        required_irf="full-enclosure",
+        require_events=True,
+        selection=None,
+    ):
+        """Iterate over observations, accessing them one at a time.
+
+        Contrary to `get_observations`, the observations are not collected
+        in a container, which is convenient to process large data stores
+        in a streaming fashion.
+
+        Parameters
+        ----------
+        obs_id : list, optional
+            Observation IDs.
+            If None, default is all observations ordered by OBS_ID.
+        skip_missing : bool, optional
+            Skip missing observations. Default is False.
+        required_irf : list of str or str, optional
+            Required HDUs, see `get_observations`. Default is `"full-enclosure"`.
+        require_events : bool, optional
+            Require events and gti table or not. Default is True.
+        selection : `~numpy.ndarray`, optional
+            Boolean array of the same length than the ``obs_table``,
+            see `get_observations`. Default is None.
+
+        Yields
+        ------
+        observation : `~gammapy.data.Observation`
+            Observation container.
+        """
+        _, obs_id_selection = self._resolve_obs_ids(
+            obs_id=obs_id, selection=selection, skip_missing=skip_missing
+        )
+        yield from self._iter_observations(
+            obs_id_selection, required_irf=required_irf, require_events=require_events
+        )
+
+    def _resolve_obs_ids(self, obs_id=None, selection=None, skip_missing=False):
+        """Validate the requested obs_id and apply the selection mask.
+
+        Returns
+        -------
+        obs_id : `~numpy.ndarray` or list
+            Requested observation IDs.
+        obs_id_selection : `~numpy.ndarray` or list
+            Requested observation IDs passing the selection.
+        """
         if selection is None:
             obs_id_selection = self.obs_ids
         else:
-            obs_id_selection = set(np.array(self.obs_ids)[selection])
+            obs_id_selection = self.obs_ids[selection]
 
         if obs_id is None:
             obs_id = obs_id_selection
         else:
-            for _ in obs_id:
-                if _ not in self.obs_ids:
-                    if skip_missing:
-                        log.warning(f"Skipping missing obs_id: {_!r}")
-                    else:
-                        raise ValueError(f"Missing obs_id: {_!r}")
-            obs_id_selection = [_ for _ in obs_id if _ in obs_id_selection]
-
-        if len(np.unique(obs_id)) != len(obs_id):
-            uniques = np.unique(obs_id, return_counts=True)
-            multiples = np.array(uniques[0][(uniques[1] > 1)])
-            log.warning(f"List of obs_id is not unique! Multiples are: {multiples}")
-
-        obs_list = []
-
-        for _ in progress_bar(obs_id_selection, desc="Obs Id"):
+            obs_id_array = np.asarray(obs_id)
+            if obs_id_array.dtype.kind in "iuf":
+                is_missing = ~np.isin(obs_id_array, self.obs_ids)
+                missing = obs_id_array[is_missing].tolist()
+            else:
+                missing = [_ for _ in obs_id if _ not in self._obs_ids_set]
+
+            for _ in missing:
+                if skip_missing:
+                    log.warning(f"Skipping missing obs_id: {_!r}")
+                else:
+                    raise ValueError(f"Missing obs_id: {_!r}")
+            obs_id_selection = self._filter_obs_id(obs_id, obs_id_selection)
+
+            # the obs_ids of the data store are unique already
+            uniques, counts = np.unique(obs_id, return_counts=True)
+            if len(uniques) != len(obs_id):
+                multiples = uniques[counts > 1]
+                log.warning(f"List of obs_id is not unique! Multiples are: {multiples}")
+
+        return obs_id, obs_id_selection
+
+    def _iter_observations(self, obs_id, required_irf, require_events):
+        """Iterate over already validated observations, skipping incomplete ones."""
+        required_irf = self._resolve_required_irf(required_irf)
+
+        for _ in progress_bar(obs_id, desc="Obs Id"):
             try:
                 obs = self.obs(_, required_irf, require_events)
             except MissingRequiredHDU as e:
                 log.warning(f"Skipping run with missing HDUs; {e}")
                 continue
 
-            obs_list.append(obs)
-
-        log.info(f"Observations selected: {len(obs_list)} out of {len(obs_id)}.")
-        return Observations(obs_list)
+            yield obs
 
     def get_observation_groups(
         self,
@@ -516,22 +721,35 @@ class DataStore:
         if selection is not None:
             obs_table = obs_table[selection]
             if obs_id is not None:
-                obs_id_selection = set(np.array(self.obs_ids)[selection])
-                obs_id = [_ for _ in obs_id if _ in obs_id_selection]
+                obs_id = self._filter_obs_id(obs_id, self.obs_ids[selection])
         if obs_id is not None:
             obs_table = obs_table.select_obs_id(obs_id)
 
         grouped = obs_table.group_by(key)
 
-        result = {}
+        groups, labels = {}, {}
         for key_value, group in zip(grouped.groups.keys, grouped.groups):
-            result[f"{key}_{key_value[0]}"] = self.get_observations(
-                group["OBS_ID"],
-                skip_missing=skip_missing,
+            label = f"{key}_{key_value[0]}"
+            groups[label] = []
+            labels.update(dict.fromkeys(group["OBS_ID"].tolist(), label))
+
+        # access all observations at once, and dispatch them into the groups
+        _, obs_id_selection = self._resolve_obs_ids(
+            obs_id=grouped["OBS_ID"], skip_missing=skip_missing
+        )
+        observations = list(
+            self._iter_observations(
+                obs_id_selection,
                 required_irf=required_irf,
                 require_events=require_events,
             )
-        return result
+        )
+        log.info(f"Observations selected: {len(observations)} out of {len(grouped)}.")
+
+        for observation in observations:
+            groups[labels[observation.obs_id]].append(observation)
+
+        return {label: Observations(group) for label, group in groups.items()}
 
     def copy_obs(self, obs_id, outdir, hdu_class=None, verbose=False, overwrite=False):
         """Create a new `~gammapy.data.DataStore` containing a subset of observations.
@@ -568,18 +786,33 @@ class DataStore:
         if self.obs_table:
             subobstable = self.obs_table.select_obs_id(obs_id)
 
-        for idx in range(len(subhdutable)):
+        # several HDUs are usually stored in the same file
+        files = dict.fromkeys(
+            (file_dir.strip(), file_name.strip())
+            for file_dir, file_name in zip(
+                subhdutable["FILE_DIR"].tolist(), subhdutable["FILE_NAME"].tolist()
+            )
+        )
+
+        base_dir = subhdutable.base_dir
+        for file_dir, file_name in files:
             # Changes to the file structure could be made here
-            loc = subhdutable.location_info(idx)
-            targetdir = outdir / loc.file_dir
-            targetdir.mkdir(exist_ok=True, parents=True)
-            cmd = ["cp"]
+            path = base_dir / file_dir / file_name
+            if not path.exists():
+                path = make_path(file_dir) / file_name
+            target = outdir / file_dir / path.name
+
+            if not path.is_file():
+                log.warning(f"File not found, skipping: {path}")
+                continue
+
+            if target.exists() and (not overwrite or target.samefile(path)):
+                continue
+
+            target.parent.mkdir(exist_ok=True, parents=True)
+            shutil.copy2(path, target)
             if verbose:
-                cmd += ["-v"]
-            if not overwrite:
-                cmd += ["-n"]
-            cmd += [str(loc.path()), str(targetdir)]
-            subprocess.run(cmd)
+                print(f"'{path}' -> '{target}'")
 
         filename = outdir / self.DEFAULT_HDU_TABLE
         subhdutable.write(filename, format="fits", overwrite=overwrite)
@@ -664,14 +897,51 @@ class DataStoreChecker(Checker):
             yield from ObservationChecker(obs).run()
 
 
-class DataStoreMaker:
+def _split_path(path):
+    """Split a `~pathlib.Path` into its POSIX directory string and file name."""
+    dirname, name = posixpath.split(path.as_posix())
+    if not dirname or dirname.endswith(":"):
+        # relative file names and Windows drive roots
+        dirname = path.parent.as_posix()
+    return dirname, name
+
+
+def _repeat_hdu_rows(events_values, irf_values):
+    """Repeat per observation values for the events and IRF HDU index rows."""
+    events_values = np.array(events_values, dtype=str)
+    irf_values = np.array(irf_values, dtype=str)
+
+    n_events = len(_EVENTS_HDU_ROWS)
+    dtype = np.result_type(events_values, irf_values)
+    values = np.empty((len(events_values), n_events + len(_IRF_HDU_ROWS)), dtype=dtype)
+    values[:, :n_events] = events_values[:, np.newaxis]
+    values[:, n_events:] = irf_values[:, np.newaxis]
+    return values.ravel()
+
+
+class DataStoreMaker(parallel.ParallelMixin):
     """Create data store index tables.
 
     This is a multistep process coded as a class.
     Users will usually call this via `DataStore.from_events_files`.
+
+    Parameters
+    ----------
+    events_paths : list of str or `~pathlib.Path`
+        List of paths to the events files.
+    irfs_paths : str or `~pathlib.Path`, or list of str or list of `~pathlib.Path`, optional
+        Path to the IRFs file. Default is None.
+    n_jobs : int, optional
+        Number of processes used to read the events headers.
+        Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+    parallel_backend : {'multiprocessing', 'ray'}, optional
+        Which backend to use for multiprocessing.
+        Default is None.
     """
 
-    def __init__(self, events_paths, irfs_paths=None):
+    def __init__(
+        self, events_paths, irfs_paths=None, n_jobs=None, parallel_backend=None
+    ):
         if isinstance(events_paths, (str, Path)):
             raise TypeError("Need list of paths, not a single string or Path object.")
 
@@ -681,9 +951,39 @@ class DataStoreMaker:
         else:
             self.irfs_paths = [make_path(path) for path in irfs_paths]
 
-        # Cache for EVENTS file header information, to avoid multiple reads
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
+
+        # Cache for EVENTS file header information, to avoid multiple reads.
+        # The IRF path is part of the key, as it defines "IRF_FILENAME".
         self._events_info = {}
 
+    def read_all_events_info(self):
+        """Read the header information of all events files not yet in the cache.
+
+        The files are read in parallel if ``n_jobs`` is larger than one.
+        """
+        paths = [
+            key
+            for key in dict.fromkeys(zip(self.events_paths, self.irfs_paths))
+            if key not in self._events_info
+        ]
+
+        if not paths:
+            return
+
+        n_jobs = min(self.n_jobs, len(paths))
+
+        infos = parallel.run_multiprocessing(
+            self.read_events_info,
+            paths,
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            task_name="Read events headers",
+        )
+
+        self._events_info.update(zip(paths, infos))
+
     def run(self):
         """Run all steps."""
         hdu_table = self.make_hdu_table()
@@ -692,12 +992,11 @@ class DataStoreMaker:
 
     def get_events_info(self, events_path, irf_path=None):
         """Read events header information."""
-        if events_path not in self._events_info:
-            self._events_info[events_path] = self.read_events_info(
-                events_path, irf_path
-            )
+        key = (events_path, irf_path)
+        if key not in self._events_info:
+            self._events_info[key] = self.read_events_info(events_path, irf_path)
 
-        return self._events_info[events_path]
+        return self._events_info[key]
 
     def get_obs_info(self, events_path, irf_path=None):
         """Read events header information and add some extra information."""
@@ -709,8 +1008,8 @@ class DataStoreMaker:
         """Read mandatory events header information."""
         log.debug(f"Reading {events_path}")
 
-        with fits.open(events_path, memmap=False) as hdu_list:
-            header = hdu_list["EVENTS"].header
+        # only the headers up to the EVENTS HDU are parsed
+        header = fits.getheader(events_path, extname="EVENTS", memmap=False)
 
         na_int, na_str = -1, "NOT AVAILABLE"
 
@@ -734,15 +1033,9 @@ class DataStoreMaker:
             info["RA_PNT"] = header["RA_PNT"] * u.deg
             info["DEC_PNT"] = header["DEC_PNT"] * u.deg
 
-        # optional header info
-        pos = SkyCoord(info["RA_PNT"], info["DEC_PNT"], unit="deg").galactic
-        info["GLON_PNT"] = pos.l
-        info["GLAT_PNT"] = pos.b
-
         # TODO: the future I/O scheme should handle the keyword depending on the format version
         if all(
-            key in list(header.keys())
-            for key in ("DATE-OBS", "TIME-OBS", "DATE-END", "TIME-END")
+            key in header for key in ("DATE-OBS", "TIME-OBS", "DATE-END", "TIME-END")
         ):
             info["DATE-OBS"] = header.get("DATE-OBS")
             info["TIME-OBS"] = header.get("TIME-OBS")
@@ -779,16 +1072,30 @@ class DataStoreMaker:
 
     def make_obs_table(self):
         """Make observation index table."""
-        rows = []
-        time_rows = []
-        for events_path, irf_path in zip(self.events_paths, self.irfs_paths):
-            row = self.get_obs_info(events_path, irf_path)
-            rows.append(row)
-            time_row = tu.extract_time_info(row)
-            time_rows.append(time_row)
-
-        names = list(rows[0].keys())
-        table = ObservationTable(rows=rows, names=names)
+        self.read_all_events_info()
+
+        rows = [
+            self.get_obs_info(events_path, irf_path)
+            for events_path, irf_path in zip(self.events_paths, self.irfs_paths)
+        ]
+        time_rows = [tu.extract_time_info(row) for row in rows]
+
+        # build the table column-wise, which avoids the row to column
+        # transpose done by the ``rows`` argument
+        columns = {}
+        for name in rows[0]:
+            values = [row[name] for row in rows]
+            if isinstance(values[0], u.Quantity):
+                values = u.Quantity(values)
+            columns[name] = values
+
+            if name == "DEC_PNT":
+                # single coordinate transform for all observations
+                pos = SkyCoord(columns["RA_PNT"], columns["DEC_PNT"]).galactic
+                columns["GLON_PNT"] = u.Quantity(pos.l)
+                columns["GLAT_PNT"] = u.Quantity(pos.b)
+
+        table = ObservationTable(columns)
 
         m = table.meta
         if not tu.unique_time_info(time_rows):
@@ -798,90 +1105,101 @@ class DataStoreMaker:
         for name in tu.TIME_KEYWORDS:
             m[name] = time_rows[0][name]
 
-        m["HDUCLASS"] = "GADF"
-        m["HDUDOC"] = "https://github.com/open-gamma-ray-astro/gamma-astro-data-formats"
-        m["HDUVERS"] = "0.2"
-        m["HDUCLAS1"] = "INDEX"
-        m["HDUCLAS2"] = "OBS"
+        m.update(_INDEX_TABLE_META, HDUCLAS2="OBS")
 
         return table
 
     def make_hdu_table(self):
         """Make HDU index table."""
-        rows = []
-        for events_path, irf_path in zip(self.events_paths, self.irfs_paths):
-            rows.extend(self.get_hdu_table_rows(events_path, irf_path))
+        self.read_all_events_info()
 
-        names = list(rows[0].keys())
-        # names = ['OBS_ID', 'HDU_TYPE', 'HDU_CLASS', 'FILE_DIR', 'FILE_NAME', 'HDU_NAME']
+        # IRF files are usually shared by many observations, so their
+        # FILE_DIR and FILE_NAME are computed once per file
+        irf_locations = {}
 
-        table = HDUIndexTable(rows=rows, names=names)
-
-        m = table.meta
-        m["HDUCLASS"] = "GADF"
-        m["HDUDOC"] = "https://github.com/open-gamma-ray-astro/gamma-astro-data-formats"
-        m["HDUVERS"] = "0.2"
-        m["HDUCLAS1"] = "INDEX"
-        m["HDUCLAS2"] = "HDU"
+        obs_ids = np.empty(len(self.events_paths), dtype=np.int64)
+        events_dirs, events_names, irf_dirs, irf_names = [], [], [], []
+        for idx, (events_path, irf_path) in enumerate(
+            zip(self.events_paths, self.irfs_paths)
+        ):
+            events_info = self.get_obs_info(events_path, irf_path)
+
+            if irf_path is None:
+                irf_path = Path(events_info["IRF_FILENAME"])
+
+            if irf_path not in irf_locations:
+                irf_locations[irf_path] = _split_path(irf_path)
+            irf_dir, irf_name = irf_locations[irf_path]
+            events_dir, events_name = _split_path(events_path)
+
+            obs_ids[idx] = events_info["OBS_ID"]
+            events_dirs.append(events_dir)
+            events_names.append(events_name)
+            irf_dirs.append(irf_dir)
+            irf_names.append(irf_name)
+
+        n_obs = len(obs_ids)
+        hdu_types, hdu_classes, hdu_names = zip(*_EVENTS_HDU_ROWS, *_IRF_HDU_ROWS)
+        # the columns are built directly as arrays of known dtype, the
+        # constant ones are tiled as fixed width string arrays
+        columns = {
+            "HDU_TYPE": np.tile(hdu_types, n_obs),
+            "HDU_CLASS": np.tile(hdu_classes, n_obs),
+            "HDU_NAME": np.tile(hdu_names, n_obs),
+            "OBS_ID": np.repeat(obs_ids, len(hdu_types)),
+            "FILE_DIR": _repeat_hdu_rows(events_dirs, irf_dirs),
+            "FILE_NAME": _repeat_hdu_rows(events_names, irf_names),
+        }
+        table = HDUIndexTable(columns)
+
+        table.meta.update(_INDEX_TABLE_META, HDUCLAS2="HDU")
 
         return table
 
-    def get_hdu_table_rows(self, events_path, irf_path=None):
-        """Make HDU index table rows for one observation."""
-        events_info = self.get_obs_info(events_path, irf_path)
-
-        info = dict(
-            OBS_ID=events_info["OBS_ID"],
-            FILE_DIR=events_path.parent.as_posix(),
-            FILE_NAME=events_path.name,
-        )
-        yield dict(HDU_TYPE="events", HDU_CLASS="events", HDU_NAME="EVENTS", **info)
-        yield dict(HDU_TYPE="gti", HDU_CLASS="gti", HDU_NAME="GTI", **info)
-
-        irf_path = Path(events_info["IRF_FILENAME"])
-        info = dict(
-            OBS_ID=events_info["OBS_ID"],
-            FILE_DIR=irf_path.parent.as_posix(),
-            FILE_NAME=irf_path.name,
-        )
-        yield dict(
-            HDU_TYPE="aeff", HDU_CLASS="aeff_2d", HDU_NAME="EFFECTIVE AREA", **info
-        )
-        yield dict(
-            HDU_TYPE="edisp", HDU_CLASS="edisp_2d", HDU_NAME="ENERGY DISPERSION", **info
-        )
-        yield dict(
-            HDU_TYPE="psf",
-            HDU_CLASS="psf_3gauss",
-            HDU_NAME="POINT SPREAD FUNCTION",
-            **info,
-        )
-        yield dict(HDU_TYPE="bkg", HDU_CLASS="bkg_3d", HDU_NAME="BACKGROUND", **info)
-
 
 class CalDBIRF:
     """Helper class to work with IRFs in CALDB format."""
 
+    # Cache of the first entry of the CALDB IRF directories, as many
+    # observations usually share the same IRF. Entries are only used while the
+    # directory modification time is unchanged and the file still exists.
+    _file_name_cache = {}
+
     def __init__(self, telescop, caldb, irf):
         self.telescop = telescop
         self.caldb = caldb
         self.irf = irf
+        # In CTA 1DC the header key is "CTA", but the directory is lower-case "cta"
+        self.file_dir = f"$CALDB/data/{telescop.lower()}/{caldb}/bcf/{irf}"
 
     @classmethod
     def from_meta(cls, meta):
         return cls(telescop=meta["TELESCOP"], caldb=meta["CALDB"], irf=meta["IRF"])
 
-    @property
-    def file_dir(self):
-        # In CTA 1DC the header key is "CTA", but the directory is lower-case "cta"
-        telescop = self.telescop.lower()
-        return f"$CALDB/data/{telescop}/{self.caldb}/bcf/{self.irf}"
-
-    @property
+    @lazyproperty
     def file_path(self):
         return Path(f"{self.file_dir}/{self.file_name}")
 
-    @property
+    @lazyproperty
     def file_name(self):
         path = make_path(self.file_dir)
-        return list(path.iterdir())[0].name
+        mtime = path.stat().st_mtime_ns
+
+        cached = self._file_name_cache.get(path)
+        if cached is not None and cached[0] == mtime and (path / cached[1]).exists():
+            return cached[1]
+
+        # only the first directory entry is needed, no need to list all of them
+        with os.scandir(path) as entries:
+            entry = next(entries, None)
+
+        if entry is None:
+            raise IndexError(f"No IRF file found in CALDB directory {path}")
+
+        self._file_name_cache[path] = mtime, entry.name
+        return entry.name
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the cache of the CALDB IRF file names."""
+        cls._file_name_cache.clear()
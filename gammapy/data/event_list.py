@@ -2,16 +2,29 @@
 import collections
 import copy
 import html
+import itertools
 import logging
 import warnings
 import numpy as np
 from astropy import units as u
-from astropy.coordinates import AltAz, Angle, SkyCoord, angular_separation
+from astropy.coordinates import (
+    AltAz,
+    Angle,
+    Latitude,
+    Longitude,
+    SkyCoord,
+    angular_separation,
+)
+from astropy.table import Column, MaskedColumn
 from astropy.table import vstack as vstack_tables
+from astropy.utils.metadata import merge as merge_meta
 from astropy.visualization import quantity_support
 import matplotlib.pyplot as plt
+from regions import CircleSkyRegion, Regions
 from gammapy.maps import MapAxis, MapCoord, RegionGeom, WcsNDMap
 from gammapy.maps.axes import UNIT_STRING_FORMAT
+from gammapy.maps.utils import INVALID_INDEX
+from gammapy.utils.compilation import get_angular_separation_compiled
 from gammapy.utils.fits import earth_location_from_dict
 from gammapy.utils.testing import Checker
 from gammapy.utils.time import time_ref_from_dict
@@ -22,6 +35,93 @@ __all__ = ["EventList"]
 
 log = logging.getLogger(__name__)
 
+# meta data keys used to compute the time reference and the observatory location
+_TIME_REF_KEYS = ("MJDREFI", "MJDREFF", "TIMESYS")
+_EARTH_LOCATION_KEYS = ("GEOLON", "GEOLAT", "GEOALT", "ALTITUDE")
+
+# minimum number of events to use the compiled angular separation, if available
+_SEPARATION_COMPILED_MIN_EVENTS = 500_000
+
+# events closer than this to a time selection bound are compared as `Time`
+_MET_TOLERANCE = 1e-6 * u.s
+
+# block size and weights of the column fingerprints used by the cache
+_FINGERPRINT_BLOCK_SIZE = 4096
+_FINGERPRINT_WEIGHTS = np.random.default_rng(0).standard_normal(_FINGERPRINT_BLOCK_SIZE)
+
+
+def _column_info(table):
+    """Attributes of the table columns that have to match for a direct stack."""
+    return [
+        (name, type(col), col.dtype, col.shape[1:], col.unit, col.description)
+        for name, col in table.columns.items()
+    ]
+
+
+def _vstack_tables(tables):
+    """Stack tables by rows, like `~astropy.table.vstack`.
+
+    If all tables have the same columns, they are concatenated column by
+    column, which avoids the column matching of `~astropy.table.vstack`.
+    """
+    if len(tables) < 2:
+        return vstack_tables(tables)
+
+    info = _column_info(tables[0])
+    if any(col_type is not Column for _, col_type, *_ in info) or any(
+        type(table) is not type(tables[0]) or _column_info(table) != info
+        for table in tables[1:]
+    ):
+        return vstack_tables(tables)
+
+    columns = [
+        col.copy(
+            data=np.concatenate([table[name].data for table in tables]),
+            copy_data=False,
+        )
+        for name, col in tables[0].columns.items()
+    ]
+
+    meta = copy.deepcopy(tables[0].meta)
+    for table in tables[1:]:
+        meta = merge_meta(meta, table.meta, metadata_conflicts="warn")
+
+    return tables[0].__class__(columns, meta=meta, copy=False)
+
+
+def _fingerprint(data):
+    """Fingerprint of the content of a numerical array, without copying it.
+
+    The wrapping sum of the raw data changes with any modified value, and the
+    weighted sums of blocks of elements also change when values are
+    reordered, e.g. by sorting.
+    """
+    data = data.reshape(-1)
+    n_blocks = len(data) // _FINGERPRINT_BLOCK_SIZE
+    size = n_blocks * _FINGERPRINT_BLOCK_SIZE
+    blocks = data[:size].reshape(n_blocks, _FINGERPRINT_BLOCK_SIZE)
+    tail = data[size:]
+    sums = np.append(
+        blocks @ _FINGERPRINT_WEIGHTS, tail @ _FINGERPRINT_WEIGHTS[: len(tail)]
+    )
+    total = np.add.reduce(data.view(f"u{data.itemsize}"), dtype=np.uint64)
+    return int(total), sums.tobytes()
+
+
+def _in_range(values, band):
+    """Mask of the values within ``[band[0], band[1])``.
+
+    For a `~astropy.units.Quantity` the bounds are converted to the unit of
+    the values, so that the comparisons run on the raw arrays.
+    """
+    if isinstance(values, u.Quantity):
+        band = u.Quantity(band[:2]).to_value(values.unit)
+        values = values.value
+
+    mask = np.less_equal(band[0], values)
+    mask &= values < band[1]
+    return mask
+
 
 class EventList:
     """Event list.
@@ -90,6 +190,62 @@ class EventList:
     def __init__(self, table, meta=None):
         self.table = table
         self.meta = meta or EventListMetaData()
+        self._cache = {}
+        self._column_snapshots = {}
+        self._column_versions = itertools.count()
+
+    def _get_column_version(self, colname):
+        """Version of a table column, increased whenever its content changes.
+
+        The column data buffer, dtype, shape and a fingerprint of the content
+        are compared with the last check, so that in-place modifications such
+        as sorting the table or assigning values are detected. Masked and
+        non-numerical columns get a new version on every call.
+        """
+        column = self.table[colname]
+        data = np.asarray(column)
+        snapshot = self._column_snapshots.get(colname)
+
+        if isinstance(column, MaskedColumn) or data.dtype.kind not in "biuf":
+            key = None
+        else:
+            key = (data.ctypes.data, data.dtype, data.shape) + _fingerprint(data)
+            if snapshot is not None and snapshot[0] == key:
+                return snapshot[1]
+
+        version = next(self._column_versions)
+        self._column_snapshots[colname] = key, version
+        return version
+
+    def _get_cached(self, name, colnames, meta_keys, func):
+        """Get a value derived from table columns and meta data.
+
+        The value is cached and recomputed only if the content of one of the
+        table columns or one of the meta data values was modified.
+
+        Parameters
+        ----------
+        name : str
+            Cache entry name.
+        colnames : tuple of str
+            Names of the columns the value is derived from.
+        meta_keys : tuple of str
+            Meta data keys the value is derived from.
+        func : callable
+            Function computing the value.
+        """
+        versions = [self._get_column_version(colname) for colname in colnames]
+        meta = [self.table.meta.get(key) for key in meta_keys]
+
+        cached = self._cache.get(name)
+        if cached is not None:
+            cached_versions, cached_meta, value = cached
+            if cached_versions == versions and cached_meta == meta:
+                return value
+
+        value = func()
+        self._cache[name] = versions, meta, value
+        return value
 
     def _repr_html_(self):
         try:
@@ -98,7 +254,9 @@ class EventList:
             return f"<pre>{html.escape(str(self))}</pre>"
 
     @classmethod
-    def read(cls, filename, hdu="EVENTS", checksum=False, **kwargs):
+    def read(
+        cls, filename, hdu="EVENTS", checksum=False, columns=None, memmap=True, **kwargs
+    ):
         """Read from FITS file.
 
         Format specification: :ref:`gadf:iact-events`
@@ -111,10 +269,16 @@ class EventList:
             Name of events HDU. Default is "EVENTS".
         checksum : bool
             If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        columns : list of str, optional
+            Names of the columns to read. Default is None, which reads all columns.
+        memmap : bool, optional
+            Whether to memory map the file. Default is True.
         """
         from gammapy.data.io import EventListReader
 
-        return EventListReader(hdu, checksum).read(filename)
+        return EventListReader(hdu, checksum, columns=columns, memmap=memmap).read(
+            filename
+        )
 
     def to_table_hdu(self, format="gadf"):
         """
@@ -149,7 +313,10 @@ class EventList:
             Keyword arguments passed to `~astropy.table.vstack`.
         """
         tables = [_.table for _ in event_lists]
-        stacked_table = vstack_tables(tables, **kwargs)
+        if kwargs:
+            stacked_table = vstack_tables(tables, **kwargs)
+        else:
+            stacked_table = _vstack_tables(tables)
         log.warning("The meta information will be empty here.")
         return cls(stacked_table)
 
@@ -163,7 +330,7 @@ class EventList:
         other : `~gammapy.data.EventList`
             Event list to stack to self.
         """
-        self.table = vstack_tables([self.table, other.table])
+        self.table = _vstack_tables([self.table, other.table])
 
     def __str__(self):
         info = self.__class__.__name__ + "\n"
@@ -186,9 +353,16 @@ class EventList:
             info += f"\tTime start       : {self.observation_time_start}\n"
             info += f"\tTime stop        : {self.observation_time_stop}\n\n"
 
-        info += f"\tMin. energy      : {np.min(self.energy):.2e}\n"
-        info += f"\tMax. energy      : {np.max(self.energy):.2e}\n"
-        info += f"\tMedian energy    : {np.median(self.energy):.2e}\n\n"
+        # single partial sort for the min, median and max energy
+        energy = self.energy
+        n_events = len(energy)
+        kth = [0, (n_events - 1) // 2, n_events // 2, n_events - 1]
+        values = np.partition(energy.value, kth)[kth] * energy.unit
+        energy_median = (values[1] + values[2]) / 2
+
+        info += f"\tMin. energy      : {values[0]:.2e}\n"
+        info += f"\tMax. energy      : {values[3]:.2e}\n"
+        info += f"\tMedian energy    : {energy_median:.2e}\n\n"
 
         if self.is_pointed_observation:
             offset_max = np.max(self.offset)
@@ -198,7 +372,9 @@ class EventList:
     @property
     def time_ref(self):
         """Time reference as a `~astropy.time.Time` object."""
-        return time_ref_from_dict(self.table.meta)
+        return self._get_cached(
+            "time_ref", (), _TIME_REF_KEYS, lambda: time_ref_from_dict(self.table.meta)
+        )
 
     @property
     def time(self):
@@ -210,22 +386,53 @@ class EventList:
         With 32-bit floats times will be incorrect by a few seconds
         when e.g. adding them to the reference time.
         """
-        met = u.Quantity(self.table["TIME"].astype("float64"), "second")
+        return self._get_cached("time", ("TIME",), _TIME_REF_KEYS, self._compute_time)
+
+    def _compute_time(self):
+        met = self.table["TIME"].astype("float64", copy=False)
+        met = u.Quantity(met, "second", copy=False)
         return self.time_ref + met
 
+    @property
+    def _is_time_sorted(self):
+        """Whether the TIME column is sorted in increasing order."""
+        return self._get_cached(
+            "is_time_sorted", ("TIME",), (), self._compute_is_time_sorted
+        )
+
+    def _compute_is_time_sorted(self):
+        met = self.table["TIME"]
+        if hasattr(met, "mask") or met.dtype.kind not in "iuf":
+            return False
+        met = met.data
+        return bool(np.all(met[1:] >= met[:-1]))
+
     @property
     def observation_time_start(self):
         """Observation start time as a `~astropy.time.Time` object."""
-        return self.time_ref + u.Quantity(self.table.meta["TSTART"], "second")
+        return self._get_cached(
+            "observation_time_start",
+            (),
+            ("TSTART",) + _TIME_REF_KEYS,
+            lambda: self.time_ref + u.Quantity(self.table.meta["TSTART"], "second"),
+        )
 
     @property
     def observation_time_stop(self):
         """Observation stop time as a `~astropy.time.Time` object."""
-        return self.time_ref + u.Quantity(self.table.meta["TSTOP"], "second")
+        return self._get_cached(
+            "observation_time_stop",
+            (),
+            ("TSTOP",) + _TIME_REF_KEYS,
+            lambda: self.time_ref + u.Quantity(self.table.meta["TSTOP"], "second"),
+        )
 
     @property
     def radec(self):
         """Event RA / DEC sky coordinates as a `~astropy.coordinates.SkyCoord` object."""
+        return self._get_cached("radec", ("RA", "DEC"), (), self._compute_radec)
+
+    def _compute_radec(self):
         lon, lat = self.table["RA"], self.table["DEC"]
         return SkyCoord(lon, lat, unit="deg", frame="icrs")
 
@@ -235,7 +442,23 @@ class EventList:
 
         Always computed from RA / DEC using Astropy.
         """
-        return self.radec.galactic
+        return self._get_cached("galactic", ("RA", "DEC"), (), self._compute_galactic)
+
+    def _compute_galactic(self):
+        # ICRS to Galactic is a fixed rotation, applied here as a single matrix
+        # instead of going through the intermediate FK5 frame
+        axes = SkyCoord(np.eye(3), representation_type="cartesian", frame="icrs")
+        matrix = axes.galactic.cartesian.xyz.value
+
+        lon = u.Quantity(self.table["RA"], "deg", copy=False).to_value("rad")
+        lat = u.Quantity(self.table["DEC"], "deg", copy=False).to_value("rad")
+        cos_lat = np.cos(lat)
+        x, y, z = matrix @ np.stack(
+            [cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)]
+        )
+
+        l, b = np.arctan2(y, x), np.arctan2(z, np.hypot(x, y))
+        return SkyCoord(np.rad2deg(l), np.rad2deg(b), unit="deg", frame="galactic")
 
     @property
     def energy(self):
@@ -246,9 +469,12 @@ class EventList:
     def galactic_median(self):
         """Median position as a `~astropy.coordinates.SkyCoord` object."""
         galactic = self.galactic
-        median_lon = np.median(galactic.l.wrap_at("180d"))
-        median_lat = np.median(galactic.b)
-        return SkyCoord(median_lon, median_lat, frame="galactic")
+        # longitudes are in [0, 360) deg, wrap them at 180 deg on plain arrays
+        lon = galactic.l.deg
+        lon = np.where(lon >= 180, lon - 360, lon)
+        median_lon = np.median(lon)
+        median_lat = np.median(galactic.b.deg)
+        return SkyCoord(median_lon, median_lat, unit="deg", frame="galactic")
 
     def select_row_subset(self, row_specifier):
         """Select table row subset.
@@ -281,6 +507,16 @@ class EventList:
         >>> print(len(events2.table))
         97978
         """
+        if (
+            isinstance(row_specifier, np.ndarray)
+            and not np.ma.isMaskedArray(row_specifier)
+            and row_specifier.dtype == bool
+            and row_specifier.shape == (len(self.table),)
+        ):
+            # taking rows by index is much faster than boolean indexing of
+            # each column, as the mask is evaluated only once
+            row_specifier = np.flatnonzero(row_specifier)
+
         table = self.table[row_specifier]
         return self.__class__(table=table)
 
@@ -306,9 +542,7 @@ class EventList:
         >>> energy_range =[1, 20] * u.TeV
         >>> event_list = event_list.select_energy(energy_range=energy_range)
         """
-        energy = self.energy
-        mask = energy_range[0] <= energy
-        mask &= energy < energy_range[1]
+        mask = _in_range(self.energy, energy_range)
         return self.select_row_subset(mask)
 
     def select_time(self, time_interval):
@@ -324,9 +558,24 @@ class EventList:
         events : `EventList`
             Copy of event list with selection applied.
         """
-        time = self.time
-        mask = time_interval[0] <= time
-        mask &= time < time_interval[1]
+        time_ref = self.time_ref
+        met = u.Quantity(self.table["TIME"], "second", copy=False)
+        met_start, met_stop = [
+            (time - time_ref).to_value(met.unit) for time in time_interval[:2]
+        ]
+
+        mask = np.less_equal(met_start, met.value)
+        mask &= met.value < met_stop
+
+        # resolve the rounding of the bounds to MET with exact time comparisons
+        tol = _MET_TOLERANCE.to_value(met.unit)
+        edges = np.abs(met.value - met_start) < tol
+        edges |= np.abs(met.value - met_stop) < tol
+
+        if np.any(edges):
+            time = time_ref + met[edges].astype("float64")
+            mask[edges] = (time_interval[0] <= time) & (time < time_interval[1])
+
         return self.select_row_subset(mask)
 
     def select_region(self, regions, wcs=None):
@@ -345,9 +594,30 @@ class EventList:
         -------
         event_list : `EventList`
             Copy of event list with selection applied.
+
+        Notes
+        -----
+        If no ``wcs`` is given and a single `~regions.CircleSkyRegion` is
+        selected, the region test is only evaluated for the events within
+        twice the circle radius from its center. The selected events are the
+        same as for the full region test.
         """
         geom = RegionGeom.from_regions(regions, wcs=wcs)
-        mask = geom.contains(self.radec)
+
+        region = regions
+        if isinstance(regions, (list, Regions)) and len(regions) == 1:
+            region = regions[0]
+
+        if wcs is None and isinstance(region, CircleSkyRegion):
+            # the region is tested in the TAN projection centered on the
+            # circle, where events beyond twice the radius are always outside
+            separation = self._separation(region.center)
+            idx = np.flatnonzero(separation < 2 * region.radius)
+            mask = np.zeros(len(self.table), dtype=bool)
+            mask[idx] = geom.contains(self.radec[idx])
+        else:
+            mask = geom.contains(self.radec)
+
         return self.select_row_subset(mask)
 
     @deprecated_renamed_argument("band", "values", "2.0")
@@ -394,15 +664,44 @@ class EventList:
                     "More than two arguments were given while selecting a range, only the first two were used for events selection."
                 )
 
-            mask = (values[0] <= col_data) & (col_data < values[1])
+            is_quantity = isinstance(values, u.Quantity) and col_data.unit is not None
+
+            if is_quantity and parameter == "TIME" and self._is_time_sorted:
+                band = values[:2].to_value(col_data.unit)
+                if not np.isnan(band).any():
+                    # events are time ordered, find the bounds by bisection
+                    idx_min, idx_max = np.searchsorted(col_data.data, band)
+                    return self.select_row_subset(np.arange(idx_min, idx_max))
+
+            if is_quantity:
+                mask = _in_range(col_data.quantity, values)
+            else:
+                mask = (values[0] <= col_data) & (col_data < values[1])
         else:
-            # Universal comparison that works for strings and numbers
-            mask = np.zeros(len(col_data), dtype=bool)
-            for value in values:
-                if not isinstance(value, str) and np.isnan(value):
-                    mask |= np.isnan(col_data.data.astype(float))
-                else:
-                    mask |= col_data == value  # Works for both strings and numbers
+            is_nan = [
+                not isinstance(value, str) and np.isnan(value) for value in values
+            ]
+            values = [value for value, nan in zip(values, is_nan) if not nan]
+
+            is_plain = (
+                col_data.dtype.kind in "biuf"
+                and not hasattr(col_data, "mask")
+                and col_data.unit is None
+                and not any(isinstance(value, u.Quantity) for value in values)
+            )
+
+            if is_plain:
+                # single pass over plain numerical columns without units
+                mask = np.isin(col_data.data, values)
+            else:
+                # Universal comparison that works for strings and numbers
+                mask = np.zeros(len(col_data), dtype=bool)
+                for value in values:
+                    mask |= col_data == value
+
+            if any(is_nan) and col_data.dtype.kind not in "biu":
+                # integer and boolean columns cannot hold NaN
+                mask |= np.isnan(col_data.data.astype(float, copy=False))
 
         return self.select_row_subset(mask)
 
@@ -462,12 +761,13 @@ class EventList:
         ax = plt.gca() if ax is None else ax
 
         # Note the events are not necessarily in time order
-        time = self.table["TIME"]
-        time = time - np.min(time)
+        time = self.table["TIME"].data
 
         ax.set_xlabel(f"Time [{u.s.to_string(UNIT_STRING_FORMAT)}]")
         ax.set_ylabel("Counts")
         y, x_edges = np.histogram(time, bins=20)
+        # shift the edges rather than the times to start at zero
+        x_edges = x_edges - np.min(time)
 
         xerr = np.diff(x_edges) / 2
         x = x_edges[:-1] + xerr
@@ -546,8 +846,15 @@ class EventList:
         if center is None:
             center = self._plot_center
 
-        offset2 = center.separation(self.radec) ** 2
-        max2 = np.percentile(offset2, q=max_percentile)
+        offset2 = self._offset2(center)
+
+        # linear percentile, as `np.percentile`, from the two neighbouring ranks
+        values = offset2.value
+        rank = max_percentile / 100 * (values.size - 1)
+        idx = int(rank)
+        idx_next = min(idx + 1, values.size - 1)
+        lo, hi = np.partition(values, [idx, idx_next])[[idx, idx_next]]
+        max2 = (lo + (rank - idx) * (hi - lo)) * offset2.unit
 
         kwargs.setdefault("histtype", "step")
         kwargs.setdefault("bins", 30)
@@ -586,15 +893,16 @@ class EventList:
 
         energy_axis = self._default_plot_energy_axis
 
-        offset = center.separation(self.radec)
+        offset = self._separation(center)
         offset_axis = MapAxis.from_bounds(
             0 * u.deg, offset.max(), nbin=30, name="offset"
         )
 
+        # histogram the raw values, in the units of the axes
         counts = np.histogram2d(
-            x=self.energy,
-            y=offset,
-            bins=(energy_axis.edges, offset_axis.edges),
+            x=self.energy.to_value(energy_axis.unit),
+            y=offset.to_value(offset_axis.unit),
+            bins=(energy_axis.edges.value, offset_axis.edges.value),
         )[0]
 
         kwargs.setdefault("norm", LogNorm())
@@ -627,7 +935,12 @@ class EventList:
         coord : `~gammapy.maps.MapCoord`
             Coordinates.
         """
-        coord = {"skycoord": self.radec}
+        # the ICRS coordinates are passed as arrays, so that no SkyCoord is
+        # created for geometries in the ICRS frame
+        coord = {
+            "lon": Longitude(self.table["RA"], unit="deg").deg,
+            "lat": Latitude(self.table["DEC"], unit="deg").deg,
+        }
 
         cols = {k.upper(): v for k, v in self.table.columns.items()}
 
@@ -638,7 +951,7 @@ class EventList:
             except KeyError:
                 raise KeyError(f"Column not found in event list: {axis.name!r}")
 
-        return MapCoord.create(coord)
+        return MapCoord.create(coord, frame="icrs")
 
     def select_mask(self, mask):
         """Select events inside a mask (`EventList`).
@@ -673,7 +986,12 @@ class EventList:
     @property
     def observatory_earth_location(self):
         """Observatory location as an `~astropy.coordinates.EarthLocation` object."""
-        return earth_location_from_dict(self.table.meta)
+        return self._get_cached(
+            "observatory_earth_location",
+            (),
+            _EARTH_LOCATION_KEYS,
+            lambda: earth_location_from_dict(self.table.meta),
+        )
 
     @property
     def observation_time_duration(self):
@@ -682,6 +1000,14 @@ class EventList:
         This is a keyword related to IACTs.
         The wall time, including dead-time.
         """
+        return self._get_cached(
+            "observation_time_duration",
+            (),
+            ("TSTART", "TSTOP") + _TIME_REF_KEYS,
+            self._compute_observation_time_duration,
+        )
+
+    def _compute_observation_time_duration(self):
         time_delta = (self.observation_time_stop - self.observation_time_start).sec
         return u.Quantity(time_delta, "s")
 
@@ -721,7 +1047,34 @@ class EventList:
     @property
     def altaz(self):
         """ALT / AZ position computed from RA / DEC as a `~astropy.coordinates.SkyCoord` object."""
-        return self.radec.transform_to(self.altaz_frame)
+        return self._get_cached(
+            "altaz",
+            ("RA", "DEC", "TIME"),
+            _TIME_REF_KEYS + _EARTH_LOCATION_KEYS,
+            lambda: self.radec.transform_to(self.altaz_frame),
+        )
+
+    @property
+    def altaz_mean(self):
+        """ALT / AZ position at the middle of the observation as a `~astropy.coordinates.SkyCoord` object.
+
+        Approximates `altaz` with a single observation time, which is much
+        faster and sufficient e.g. for quick look checks.
+        """
+        return self._get_cached(
+            "altaz_mean",
+            ("RA", "DEC"),
+            ("TSTART", "TSTOP") + _TIME_REF_KEYS + _EARTH_LOCATION_KEYS,
+            self._compute_altaz_mean,
+        )
+
+    def _compute_altaz_mean(self):
+        meta = self.table.meta
+        met_mean = u.Quantity(0.5 * (meta["TSTART"] + meta["TSTOP"]), "second")
+        frame = AltAz(
+            obstime=self.time_ref + met_mean, location=self.observatory_earth_location
+        )
+        return self.radec.transform_to(frame)
 
     @property
     def altaz_from_table(self):
@@ -733,6 +1086,11 @@ class EventList:
     @property
     def pointing_radec(self):
         """Pointing RA / DEC sky coordinates as a `~astropy.coordinates.SkyCoord` object."""
+        return self._get_cached(
+            "pointing_radec", (), ("RA_PNT", "DEC_PNT"), self._compute_pointing_radec
+        )
+
+    def _compute_pointing_radec(self):
         info = self.table.meta
         lon, lat = info["RA_PNT"], info["DEC_PNT"]
         return SkyCoord(lon, lat, unit="deg", frame="icrs")
@@ -740,18 +1098,83 @@ class EventList:
     @property
     def offset(self):
         """Event offset from the array pointing position as an `~astropy.coordinates.Angle`."""
-        position = self.radec
-        center = self.pointing_radec
-        offset = center.separation(position)
-        return Angle(offset, unit="deg")
+        return self._get_cached(
+            "offset", ("RA", "DEC"), ("RA_PNT", "DEC_PNT"), self._compute_offset
+        )
+
+    def _compute_offset(self):
+        return self._separation(self.pointing_radec)
 
     @property
     def offset_from_median(self):
         """Event offset from the median position as an `~astropy.coordinates.Angle`."""
-        position = self.radec
-        center = self.galactic_median
-        offset = center.separation(position)
-        return Angle(offset, unit="deg")
+        return self._separation(self.galactic_median)
+
+    def _separation(self, center):
+        """Angular separation of the events from a given position.
+
+        Computed directly from the RA / DEC columns, without creating
+        a `~astropy.coordinates.SkyCoord` for the events. For large event
+        lists, the compiled version is used with the "jit" compilation backend.
+
+        Parameters
+        ----------
+        center : `~astropy.coordinates.SkyCoord`
+            Center position.
+
+        Returns
+        -------
+        separation : `~astropy.coordinates.Angle`
+            Angular separation.
+        """
+        center = center.icrs
+        lon = u.Quantity(self.table["RA"], "deg", copy=False)
+        lat = u.Quantity(self.table["DEC"], "deg", copy=False)
+
+        separation_compiled = None
+        if lon.ndim == 1 and len(lon) >= _SEPARATION_COMPILED_MIN_EVENTS:
+            separation_compiled = get_angular_separation_compiled()
+
+        if separation_compiled is not None:
+            separation = separation_compiled(
+                np.ascontiguousarray(lon.to_value("rad"), dtype=np.float64),
+                np.ascontiguousarray(lat.to_value("rad"), dtype=np.float64),
+                center.ra.rad,
+                center.dec.rad,
+            )
+            return Angle(np.rad2deg(separation), unit="deg")
+
+        separation = angular_separation(center.ra, center.dec, lon, lat)
+        return Angle(separation, unit="deg")
+
+    def _offset2(self, center):
+        """Squared angular separation of the events from a given position.
+
+        Computed with the haversine formula in a single pass over the
+        RA / DEC columns.
+
+        Parameters
+        ----------
+        center : `~astropy.coordinates.SkyCoord`
+            Center position.
+
+        Returns
+        -------
+        offset2 : `~astropy.units.Quantity`
+            Squared angular separation in deg^2.
+        """
+        center = center.icrs
+        lon = u.Quantity(self.table["RA"], "deg", copy=False).to_value("rad")
+        lat = u.Quantity(self.table["DEC"], "deg", copy=False).to_value("rad")
+
+        hav = np.sin(0.5 * (lat - center.dec.rad)) ** 2
+        hav += (
+            np.cos(lat)
+            * np.cos(center.dec.rad)
+            * np.sin(0.5 * (lon - center.ra.rad)) ** 2
+        )
+        separation = 2 * np.arcsin(np.sqrt(np.clip(hav, 0, 1)))
+        return u.Quantity(np.rad2deg(separation) ** 2, "deg2", copy=False)
 
     def select_offset(self, offset_band):
         """Select events in offset band.
@@ -777,9 +1200,7 @@ class EventList:
         12688
 
         """
-        offset = self.offset
-        mask = offset_band[0] <= offset
-        mask &= offset < offset_band[1]
+        mask = _in_range(self.offset, offset_band)
         return self.select_row_subset(mask)
 
     def select_rad_max(self, rad_max, position=None):
@@ -801,7 +1222,7 @@ class EventList:
             position = self.pointing_radec
 
         offset = position.separation(self.pointing_radec)
-        separation = position.separation(self.radec)
+        separation = self._separation(position)
 
         rad_max_for_events = rad_max.evaluate(
             method="nearest", energy=self.energy, offset=offset
@@ -901,7 +1322,13 @@ class EventList:
             }
 
         m = WcsNDMap.create(**opts)
-        m.fill_by_coord(self.radec)
+
+        # count the events per pixel in a single pass
+        idx_lon, idx_lat = m.geom.coord_to_idx(self.galactic)
+        valid = (idx_lon != INVALID_INDEX.int) & (idx_lat != INVALID_INDEX.int)
+        idx = np.ravel_multi_index((idx_lat[valid], idx_lon[valid]), m.data.shape)
+        m.data += np.bincount(idx, minlength=m.data.size).reshape(m.data.shape)
+
         m = m.smooth(width=0.5)
         return m
 
@@ -922,7 +1349,8 @@ class EventList:
 
     def copy(self):
         """Copy event list (`EventList`)."""
-        return copy.deepcopy(self)
+        # Table.copy copies the column data and meta, the cache is not copied
+        return self.__class__(table=self.table.copy(), meta=copy.deepcopy(self.meta))
 
 
 class EventListChecker(Checker):
@@ -947,40 +1375,42 @@ class EventListChecker(Checker):
     accuracy = {"angle": Angle("1 arcsec"), "time": u.Quantity(1, "microsecond")}
 
     # https://gamma-astro-data-formats.readthedocs.io/en/latest/events/events.html#mandatory-header-keywords  # noqa: E501
-    meta_required = [
-        "HDUCLASS",
-        "HDUDOC",
-        "HDUVERS",
-        "HDUCLAS1",
-        "OBS_ID",
-        "TSTART",
-        "TSTOP",
-        "ONTIME",
-        "LIVETIME",
-        "DEADC",
-        "RA_PNT",
-        "DEC_PNT",
-        # TODO: what to do about these?
-        # They are currently listed as required in the spec,
-        # but I think we should just require ICRS and those
-        # are irrelevant, should not be used.
-        # 'RADECSYS',
-        # 'EQUINOX',
-        "ORIGIN",
-        "TELESCOP",
-        "INSTRUME",
-        "CREATOR",
-        # https://gamma-astro-data-formats.readthedocs.io/en/latest/general/time.html#time-formats  # noqa: E501
-        "MJDREFI",
-        "MJDREFF",
-        "TIMEUNIT",
-        "TIMESYS",
-        "TIMEREF",
-        # https://gamma-astro-data-formats.readthedocs.io/en/latest/general/coordinates.html#coords-location  # noqa: E501
-        "GEOLON",
-        "GEOLAT",
-        "ALTITUDE",
-    ]
+    meta_required = frozenset(
+        [
+            "HDUCLASS",
+            "HDUDOC",
+            "HDUVERS",
+            "HDUCLAS1",
+            "OBS_ID",
+            "TSTART",
+            "TSTOP",
+            "ONTIME",
+            "LIVETIME",
+            "DEADC",
+            "RA_PNT",
+            "DEC_PNT",
+            # TODO: what to do about these?
+            # They are currently listed as required in the spec,
+            # but I think we should just require ICRS and those
+            # are irrelevant, should not be used.
+            # 'RADECSYS',
+            # 'EQUINOX',
+            "ORIGIN",
+            "TELESCOP",
+            "INSTRUME",
+            "CREATOR",
+            # https://gamma-astro-data-formats.readthedocs.io/en/latest/general/time.html#time-formats  # noqa: E501
+            "MJDREFI",
+            "MJDREFF",
+            "TIMEUNIT",
+            "TIMESYS",
+            "TIMEREF",
+            # https://gamma-astro-data-formats.readthedocs.io/en/latest/general/coordinates.html#coords-location  # noqa: E501
+            "GEOLON",
+            "GEOLAT",
+            "ALTITUDE",
+        ]
+    )
 
     _col = collections.namedtuple("col", ["name", "unit"])
     columns_required = [
@@ -999,7 +1429,7 @@ class EventListChecker(Checker):
         return {"level": level, "obs_id": obs_id, "msg": msg}
 
     def check_meta(self):
-        meta_missing = sorted(set(self.meta_required) - set(self.event_list.table.meta))
+        meta_missing = sorted(self.meta_required.difference(self.event_list.table.meta))
         if meta_missing:
             yield self._record(
                 level="error", msg=f"Missing meta keys: {meta_missing!r}"
@@ -1011,8 +1441,9 @@ class EventListChecker(Checker):
         if len(t) == 0:
             yield self._record(level="error", msg="Events table has zero rows")
 
+        colnames = frozenset(t.colnames)
         for name, unit in self.columns_required:
-            if name not in t.colnames:
+            if name not in colnames:
                 yield self._record(level="error", msg=f"Missing table column: {name!r}")
             else:
                 if u.Unit(unit) != (t[name].unit or ""):
@@ -1021,15 +1452,23 @@ class EventListChecker(Checker):
                     )
 
     def check_times(self):
-        dt = (self.event_list.time - self.event_list.observation_time_start).sec
-        if dt.min() < self.accuracy["time"].to_value("s"):
+        # compare in MET seconds, relative to the same time reference
+        meta = self.event_list.table.meta
+        met = u.Quantity(self.event_list.table["TIME"], "second", copy=False)
+        unit = met.unit
+        met = met.value
+        met_start = u.Quantity(meta["TSTART"], "second").to_value(unit)
+        met_stop = u.Quantity(meta["TSTOP"], "second").to_value(unit)
+        tolerance = self.accuracy["time"].to_value(unit)
+
+        if met.min() - met_start < tolerance:
             yield self._record(level="error", msg="Event times before obs start time")
 
-        dt = (self.event_list.time - self.event_list.observation_time_stop).sec
-        if dt.max() > self.accuracy["time"].to_value("s"):
+        if met.max() - met_stop > tolerance:
             yield self._record(level="error", msg="Event times after the obs end time")
 
-        if np.min(np.diff(dt)) <= 0:
+        # compare neighbours directly instead of building the float differences
+        if np.any(met[1:] <= met[:-1]):
             yield self._record(level="error", msg="Events are not time-ordered.")
 
     def check_coordinates_galactic(self):
@@ -1039,9 +1478,15 @@ class EventListChecker(Checker):
         if "GLON" not in t.colnames:
             return
 
-        galactic = SkyCoord(t["GLON"], t["GLAT"], unit="deg", frame="galactic")
-        separation = self.event_list.radec.separation(galactic).to("arcsec")
-        if separation.max() > self.accuracy["angle"]:
+        # compare with the cached Galactic positions on plain arrays in radians
+        galactic = self.event_list.galactic
+        separation = angular_separation(
+            galactic.l.rad,
+            galactic.b.rad,
+            u.Quantity(t["GLON"], "deg", copy=False).to_value("rad"),
+            u.Quantity(t["GLAT"], "deg", copy=False).to_value("rad"),
+        )
+        if separation.max() > self.accuracy["angle"].to_value("rad"):
             yield self._record(
                 level="error", msg="GLON / GLAT not consistent with RA / DEC"
             )
@@ -1055,12 +1500,12 @@ class EventListChecker(Checker):
 
         altaz_astropy = self.event_list.altaz
         separation = angular_separation(
-            altaz_astropy.data.lon,
-            altaz_astropy.data.lat,
-            t["AZ"].quantity,
-            t["ALT"].quantity,
+            altaz_astropy.data.lon.rad,
+            altaz_astropy.data.lat.rad,
+            t["AZ"].quantity.to_value("rad"),
+            t["ALT"].quantity.to_value("rad"),
         )
-        if separation.max() > self.accuracy["angle"]:
+        if separation.max() > self.accuracy["angle"].to_value("rad"):
             yield self._record(
                 level="error", msg="ALT / AZ not consistent with RA / DEC"
             )
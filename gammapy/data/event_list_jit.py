@@ -0,0 +1,38 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
+from numba import jit, prange
+
+
+@jit("f8[:](f8[:],f8[:],f8,f8)", nopython=True, nogil=True, parallel=True, cache=True)
+def angular_separation_jit(lon, lat, lon_center, lat_center):
+    """Angular separation to a center position, using the Vincenty formula.
+
+    Parameters
+    ----------
+    lon, lat : `~numpy.ndarray`
+        Longitudes and latitudes in radians.
+    lon_center, lat_center : float
+        Longitude and latitude of the center position in radians.
+
+    Returns
+    -------
+    separation : `~numpy.ndarray`
+        Angular separation in radians.
+    """
+    sin_lat_center = np.sin(lat_center)
+    cos_lat_center = np.cos(lat_center)
+
+    ni = lon.shape[0]
+    separation = np.empty(ni)
+    for i in prange(ni):
+        sin_dlon = np.sin(lon[i] - lon_center)
+        cos_dlon = np.cos(lon[i] - lon_center)
+        sin_lat = np.sin(lat[i])
+        cos_lat = np.cos(lat[i])
+
+        num1 = cos_lat * sin_dlon
+        num2 = cos_lat_center * sin_lat - sin_lat_center * cos_lat * cos_dlon
+        denominator = sin_lat_center * sin_lat + cos_lat_center * cos_lat * cos_dlon
+        separation[i] = np.arctan2(np.hypot(num1, num2), denominator)
+
+    return separation
@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 import numpy as np
+from astropy.io import fits
 from astropy.table import Table
 from astropy.utils import lazyproperty
 from gammapy.utils.fits import HDULocation
@@ -50,14 +51,18 @@ class HDUIndexTable(Table):
 
         Parameters
         ----------
-        filename : `pathlib.Path` or str
-            Filename.
+        filename : `pathlib.Path`, str or `~astropy.io.fits.HDUList`
+            Filename, or already opened FITS file.
         **kwargs : dict, optional
             Keyword arguments passed to `~astropy.table.Table.read`.
         """
-        filename = make_path(filename)
+        if isinstance(filename, fits.HDUList):
+            path = make_path(filename.filename())
+        else:
+            filename = path = make_path(filename)
+
         table = super().read(filename, **kwargs)
-        table.meta["BASE_DIR"] = filename.parent.as_posix()
+        table.meta["BASE_DIR"] = path.parent.as_posix()
 
         # TODO: this is a workaround for the joint-crab validation with astropy>4.0.
         # TODO: Remove when handling of empty columns is clarified
@@ -154,11 +159,11 @@ class HDUIndexTable(Table):
         selection = self["OBS_ID"] == obs_id
 
         if hdu_class:
-            is_hdu_class = self._hdu_class_stripped == hdu_class
+            is_hdu_class = self._is_code(self._hdu_class_codes, hdu_class)
             selection &= is_hdu_class
 
         if hdu_type:
-            is_hdu_type = self._hdu_type_stripped == hdu_type
+            is_hdu_type = self._is_code(self._hdu_type_codes, hdu_type)
             selection &= is_hdu_type
 
         idx = np.where(selection)[0]
@@ -183,6 +188,23 @@ class HDUIndexTable(Table):
     def _hdu_type_stripped(self):
         return np.array([_.strip() for _ in self["HDU_TYPE"]])
 
+    @lazyproperty
+    def _hdu_class_codes(self):
+        return np.unique(self._hdu_class_stripped, return_inverse=True)
+
+    @lazyproperty
+    def _hdu_type_codes(self):
+        return np.unique(self._hdu_type_stripped, return_inverse=True)
+
+    @staticmethod
+    def _is_code(codes, value):
+        """Mask of the rows matching value, compared using integer codes."""
+        values, inverse = codes
+        idx = np.searchsorted(values, value)
+        if idx < len(values) and values[idx] == value:
+            return inverse == idx
+        return np.zeros(len(inverse), dtype=bool)
+
     @lazyproperty
     def obs_id_unique(self):
         """Observation IDs (unique)."""
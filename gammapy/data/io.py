@@ -18,15 +18,30 @@ class EventListReader:
         Name of events HDU. Default is "EVENTS".
     checksum : bool
         If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+    columns : list of str, optional
+        Names of the columns to read. Default is None, which reads all columns.
+    memmap : bool, optional
+        Whether to memory map the file. Default is True.
     """
 
-    def __init__(self, hdu="EVENTS", checksum=False):
+    def __init__(self, hdu="EVENTS", checksum=False, columns=None, memmap=True):
         self.hdu = hdu
         self.checksum = checksum
+        self.columns = columns
+        self.memmap = memmap
 
     @staticmethod
-    def from_gadf_hdu(events_hdu):
-        """Create EventList from gadf HDU."""
+    def from_gadf_hdu(events_hdu, columns=None):
+        """Create EventList from gadf HDU.
+
+        If ``columns`` is given, only these columns are converted to the table.
+        """
+        if columns is not None:
+            events_hdu = fits.BinTableHDU.from_columns(
+                [events_hdu.columns[name] for name in columns],
+                header=events_hdu.header,
+            )
+
         table = Table.read(events_hdu)
         meta = EventListMetaData.from_header(table.meta)
         return EventList(table=table, meta=meta)
@@ -50,7 +65,7 @@ class EventListReader:
         """
         filename = make_path(filename)
 
-        with fits.open(filename) as hdulist:
+        with fits.open(filename, memmap=self.memmap) as hdulist:
             events_hdu = hdulist[self.hdu]
 
             if self.checksum:
@@ -64,7 +79,7 @@ class EventListReader:
                 format = self.identify_format_from_hduclass(events_hdu)
 
             if format == "gadf" or format == "ogip":
-                return self.from_gadf_hdu(events_hdu)
+                return self.from_gadf_hdu(events_hdu, columns=self.columns)
             else:
                 raise ValueError(f"Unknown format :{format}")
 
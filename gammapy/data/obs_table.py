@@ -2,6 +2,7 @@
 from collections import namedtuple
 import numpy as np
 from astropy.coordinates import Angle, SkyCoord
+from astropy.io import fits
 from astropy.table import Table
 from astropy.units import Quantity, Unit
 from gammapy.utils.regions import SphericalCircleSkyRegion
@@ -24,12 +25,14 @@ class ObservationTable(Table):
 
         Parameters
         ----------
-        filename : `pathlib.Path` or str
-            Filename.
+        filename : `pathlib.Path`, str or `~astropy.io.fits.HDUList`
+            Filename, or already opened FITS file.
         **kwargs : dict, optional
             Keyword arguments passed to `~astropy.table.Table.read`.
         """
-        return super().read(make_path(filename), **kwargs)
+        if not isinstance(filename, fits.HDUList):
+            filename = make_path(filename)
+        return super().read(filename, **kwargs)
 
     @property
     def pointing_radec(self):
@@ -18,7 +18,7 @@ import matplotlib.pyplot as plt
 from gammapy.irf import FoVAlignment
 from gammapy.utils.coordinates import FoVAltAzFrame, FoVICRSFrame
 from gammapy.utils.deprecation import GammapyDeprecationWarning
-from gammapy.utils.fits import LazyFitsData, earth_location_to_dict
+from gammapy.utils.fits import HDULocation, LazyFitsData, earth_location_to_dict
 from gammapy.utils.metadata import CreatorMetaData, TargetMetaData, TimeInfoMetaData
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import Checker
@@ -89,6 +89,13 @@ class Observation:
         pointing=None,
         location=None,
     ):
+        # by default, the pointing and metadata are read from the events header
+        if isinstance(events, HDULocation):
+            if pointing is None:
+                pointing = events.copy(hdu_class="pointing")
+            if meta is None:
+                meta = events.copy(hdu_class="observation_metadata")
+
         self.obs_id = obs_id
         self.aeff = aeff
         self.edisp = edisp
@@ -725,7 +732,7 @@ class Observations(collections.abc.MutableSequence):
 
     def __setitem__(self, key, obs):
         if isinstance(obs, Observation):
-            if obs in self:
+            if obs in self._observations:
                 log.warning(
                     f"Observation with obs_id {obs.obs_id} already belongs to Observations."
                 )
@@ -735,7 +742,7 @@ class Observations(collections.abc.MutableSequence):
 
     def insert(self, idx, obs):
         if isinstance(obs, Observation):
-            if obs in self:
+            if obs in self._observations:
                 log.warning(
                     f"Observation with obs_id {obs.obs_id} already belongs to Observations."
                 )
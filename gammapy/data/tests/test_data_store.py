@@ -1,14 +1,15 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import inspect
 import logging
 import os
 from pathlib import Path
 import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
 from astropy.io import fits
-from gammapy.data import DataStore
-from gammapy.data.data_store import DataStoreMaker
+from gammapy.data import DataStore, HDUIndexTable, ObservationTable
+from gammapy.data.data_store import CalDBIRF, DataStoreMaker, MissingRequiredHDU
 from gammapy.irf import (
     Background3D,
     EffectiveAreaTable2D,
@@ -380,3 +381,247 @@ def test_data_store_no_events():
     for obs in observations:
         assert not obs.events
         assert not obs.gti
+
+
+def make_hdu_table(obs_ids, hdu_types):
+    rows = []
+    for obs_id in obs_ids:
+        for hdu_type, hdu_class in hdu_types:
+            rows.append(
+                dict(
+                    OBS_ID=obs_id,
+                    HDU_TYPE=hdu_type,
+                    HDU_CLASS=hdu_class,
+                    FILE_DIR="data",
+                    FILE_NAME=f"run_{obs_id}.fits",
+                    HDU_NAME=hdu_type.upper(),
+                )
+            )
+    return HDUIndexTable(rows=rows)
+
+
+def test_data_store_obs_hdu_index():
+    hdu_types = [("events", "events"), ("gti", "gti"), ("aeff", "aeff_2d")]
+    hdu_table = make_hdu_table([3, 1, 2], hdu_types)
+    data_store = DataStore(hdu_table=hdu_table)
+
+    assert_allclose(data_store.obs_ids, [1, 2, 3])
+
+    obs = data_store.obs(2, required_irf=["aeff"])
+    assert obs.obs_id == 2
+    assert obs.available_hdus == ["events", "gti", "aeff"]
+    assert obs.__dict__["_aeff_hdu"].file_name == "run_2.fits"
+
+    with pytest.raises(MissingRequiredHDU):
+        data_store.obs(2, required_irf=["aeff", "edisp"])
+
+    with pytest.raises(ValueError):
+        data_store.obs(4)
+
+    data_store.hdu_table = make_hdu_table([4], hdu_types)
+    assert_allclose(data_store.obs_ids, [4])
+    assert data_store.obs(4, required_irf=["aeff"]).obs_id == 4
+
+
+def test_data_store_obs_ids_hdu_table_inplace():
+    hdu_types = [("events", "events"), ("gti", "gti"), ("aeff", "aeff_2d")]
+    hdu_table = make_hdu_table([1, 2, 3], hdu_types)
+    data_store = DataStore(hdu_table=hdu_table)
+
+    obs_ids = data_store.obs_ids
+    with pytest.raises(ValueError):
+        obs_ids[0] = 42
+    assert_allclose(data_store.obs_ids, [1, 2, 3])
+
+    hdu_table.remove_rows([0, 1, 2])
+    assert_allclose(data_store.obs_ids, [2, 3])
+
+    with pytest.raises(ValueError):
+        data_store.obs(1)
+
+    obs = data_store.obs(2, required_irf=["aeff"])
+    assert obs.__dict__["_aeff_hdu"].file_name == "run_2.fits"
+
+    hdu_table["OBS_ID"] = hdu_table["OBS_ID"] + 10
+    assert_allclose(data_store.obs_ids, [12, 13])
+    assert data_store.obs(12, required_irf=["aeff"]).obs_id == 12
+
+
+def test_data_store_get_observations_missing(caplog):
+    hdu_types = [("events", "events"), ("gti", "gti"), ("aeff", "aeff_2d")]
+    data_store = DataStore(hdu_table=make_hdu_table([1, 2, 3], hdu_types))
+
+    with pytest.raises(ValueError, match="Missing obs_id: 4"):
+        data_store.get_observations([3, 4], required_irf=["aeff"])
+
+    with caplog.at_level(logging.WARNING):
+        observations = data_store.get_observations(
+            np.array([3, 4, 1]), skip_missing=True, required_irf=["aeff"]
+        )
+    assert observations.ids == ["3", "1"]
+    assert "Skipping missing obs_id: 4" in [_.message for _ in caplog.records]
+
+
+def test_data_store_iter_observations():
+    hdu_types = [("events", "events"), ("gti", "gti"), ("aeff", "aeff_2d")]
+    hdu_table = make_hdu_table([1, 2, 3], hdu_types)
+    hdu_table.remove_row(7)
+    data_store = DataStore(hdu_table=hdu_table)
+
+    observations = data_store.iter_observations(required_irf=["aeff"])
+    assert inspect.isgenerator(observations)
+    assert [obs.obs_id for obs in observations] == [1, 2]
+
+    observations = data_store.iter_observations(
+        [3, 2], required_irf="all-optional", require_events=False
+    )
+    assert [obs.obs_id for obs in observations] == [3, 2]
+
+
+def test_data_store_from_file_index_tables(tmp_path):
+    hdu_types = [("events", "events"), ("gti", "gti")]
+    index_hdu = fits.table_to_hdu(make_hdu_table([1, 2], hdu_types))
+    index_hdu.name = "HDU_INDEX"
+    obs_hdu = fits.table_to_hdu(ObservationTable({"OBS_ID": [1, 2]}))
+    obs_hdu.name = "OBS_INDEX"
+
+    filename = tmp_path / "index.fits.gz"
+    fits.HDUList([fits.PrimaryHDU(), index_hdu, obs_hdu]).writeto(filename)
+
+    data_store = DataStore.from_file(filename)
+    assert data_store.hdu_table.base_dir == tmp_path
+    assert len(data_store.hdu_table) == 4
+    assert_allclose(data_store.obs_table["OBS_ID"], [1, 2])
+    assert data_store.obs(2, required_irf="all-optional").obs_id == 2
+
+
+def test_data_store_obs_table_unique():
+    obs_table = ObservationTable({"OBS_ID": [1, 2, 3], "ZEN_PNT": [10, 20, 30]})
+    data_store = DataStore(obs_table=obs_table)
+    assert data_store.obs_table is not obs_table
+    assert_allclose(data_store.obs_table["ZEN_PNT"], [10, 20, 30])
+
+    data_store.obs_table["RUN_TYPE"] = "science"
+    obs_table.meta["TELESCOP"] = "HESS"
+    obs_table.remove_row(0)
+    assert "RUN_TYPE" not in obs_table.colnames
+    assert "TELESCOP" not in data_store.obs_table.meta
+    assert_allclose(data_store.obs_table["OBS_ID"], [1, 2, 3])
+
+    obs_table = ObservationTable({"OBS_ID": [3, 1, 3], "ZEN_PNT": [10, 20, 30]})
+    data_store = DataStore(obs_table=obs_table)
+    assert_allclose(data_store.obs_table["OBS_ID"], [1, 3])
+    assert_allclose(data_store.obs_table["ZEN_PNT"], [20, 10])
+
+
+def write_events_file(path, obs_id, **kwargs):
+    header = fits.Header()
+    header["OBS_ID"] = obs_id
+    header["TSTART"] = 100.0 * obs_id
+    header["TSTOP"] = 100.0 * obs_id + 50
+    header["ONTIME"] = 50.0
+    header["LIVETIME"] = 45.0
+    header["DEADC"] = 0.9
+    header["TELESCOP"] = "TEST"
+    header["RA_PNT"] = 83.6 + obs_id
+    header["DEC_PNT"] = 22.0
+    header["MJDREFI"] = 51544
+    header["MJDREFF"] = 0.5
+    header["TIMEUNIT"] = "s"
+    header["TIMESYS"] = "TT"
+    header["TIMEREF"] = "LOCAL"
+    header.update(kwargs)
+    hdu = fits.BinTableHDU.from_columns(
+        [fits.Column(name="ENERGY", format="E", array=np.ones(obs_id))],
+        header=header,
+        name="EVENTS",
+    )
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(path)
+    return path
+
+
+@pytest.fixture()
+def events_paths(tmp_path):
+    return [
+        write_events_file(tmp_path / f"events_{obs_id}.fits", obs_id)
+        for obs_id in [1, 2, 3]
+    ]
+
+
+def test_data_store_maker_events_files(events_paths):
+    data_store = DataStoreMaker(events_paths).run()
+
+    obs_table = data_store.obs_table
+    assert_allclose(obs_table["OBS_ID"], [1, 2, 3])
+    assert_allclose(obs_table["EVENT_COUNT"], [1, 2, 3])
+    assert_allclose(obs_table["RA_PNT"], [84.6, 85.6, 86.6])
+    assert obs_table["RA_PNT"].unit == "deg"
+    assert obs_table.meta["MJDREFI"] == 51544
+
+    hdu_table = data_store.hdu_table
+    assert len(hdu_table) == 18
+    assert hdu_table["FILE_NAME"][0] == "events_1.fits"
+    assert hdu_table["FILE_NAME"][2] == "events_1.fits"
+
+    data_store_parallel = DataStoreMaker(events_paths, n_jobs=2).run()
+    assert_allclose(data_store_parallel.obs_table["TSTART"], obs_table["TSTART"])
+    assert_allclose(data_store_parallel.obs_table["GLON_PNT"], obs_table["GLON_PNT"])
+
+    maker = DataStoreMaker(events_paths, n_jobs=2)
+    hdu_table_parallel = maker.make_hdu_table()
+    assert len(maker._events_info) == 3
+    assert_equal(hdu_table_parallel["FILE_NAME"], hdu_table["FILE_NAME"])
+
+
+def test_data_store_maker_events_info_cache(events_paths, tmp_path):
+    irfs_paths = [tmp_path / "irf_a.fits", tmp_path / "irf_b.fits"]
+    maker = DataStoreMaker([events_paths[0]] * 2, irfs_paths)
+    hdu_table = maker.make_hdu_table()
+
+    assert len(maker._events_info) == 2
+    assert_equal(hdu_table["FILE_NAME"][[2, 8]], ["irf_a.fits", "irf_b.fits"])
+
+    info = maker.get_obs_info(events_paths[0], irfs_paths[0])
+    assert info is maker.get_obs_info(events_paths[0], irfs_paths[0])
+
+
+def test_read_events_info_drift(tmp_path):
+    path = write_events_file(
+        tmp_path / "events.fits", 1, OBS_MODE="DRIFT", ALT_PNT=70.0, AZ_PNT=0.0
+    )
+
+    info = DataStoreMaker.read_events_info(path)
+    assert_allclose(info["ZEN_PNT"].to_value("deg"), 20)
+    assert "RA_PNT" not in info
+    assert "GLON_PNT" not in info
+
+
+def test_caldb_irf(tmp_path, monkeypatch):
+    path = tmp_path / "data/cta/1dc/bcf/South_z20_50h"
+    path.mkdir(parents=True)
+    (path / "irf_file.fits").touch()
+    monkeypatch.setenv("CALDB", str(tmp_path))
+
+    caldb_irf = CalDBIRF.from_meta(
+        {"TELESCOP": "CTA", "CALDB": "1dc", "IRF": "South_z20_50h"}
+    )
+    assert caldb_irf.file_dir == "$CALDB/data/cta/1dc/bcf/South_z20_50h"
+    assert caldb_irf.file_name == "irf_file.fits"
+    assert caldb_irf.file_path == Path(
+        "$CALDB/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
+    )
+
+    # renaming or deleting the file invalidates the cached file name
+    (path / "irf_file.fits").rename(path / "other_file.fits")
+    caldb_irf = CalDBIRF(telescop="CTA", caldb="1dc", irf="South_z20_50h")
+    assert caldb_irf.file_name == "other_file.fits"
+
+    (path / "other_file.fits").unlink()
+    caldb_irf = CalDBIRF(telescop="CTA", caldb="1dc", irf="South_z20_50h")
+    with pytest.raises(IndexError, match="No IRF file found"):
+        caldb_irf.file_name
+
+    (path / "new_file.fits").touch()
+    CalDBIRF.clear_cache()
+    caldb_irf = CalDBIRF(telescop="CTA", caldb="1dc", irf="South_z20_50h")
+    assert caldb_irf.file_name == "new_file.fits"
@@ -7,8 +7,8 @@ from astropy.coordinates import SkyCoord
 from astropy.table import Table
 from regions import CircleSkyRegion, RectangleSkyRegion
 from gammapy.data import GTI, EventList, Observation, FixedPointingInfo
-from gammapy.maps import MapAxis, WcsGeom
-from gammapy.utils.testing import mpl_plot_check, requires_data
+from gammapy.maps import Map, MapAxis, RegionGeom, WcsGeom
+from gammapy.utils.testing import mpl_plot_check, requires_data, requires_dependency
 
 
 class TestEventListBasic:
@@ -24,52 +24,289 @@ class TestEventListBasic:
     def test_eventlist_printin(self):
         print(self.events)
 
+    def test_copy(self):
+        events = self.events.copy()
+        events.table["RA"][0] = 1.0
+        events.table.meta["OBS_ID"] = 1
+        events.meta.event_class = "std"
+
+        assert_allclose(self.events.table["RA"][0], 0.0)
+        assert "OBS_ID" not in self.events.table.meta
+        assert self.events.meta.event_class is None
+
+    def test_radec_cache(self):
+        events = self.events.copy()
+        radec = events.radec
+        assert events.radec is radec
+
+        events.table["RA"] = [1.0, 1.0, 1.0, 11.0] * u.deg
+        assert events.radec is not radec
+        assert_allclose(events.radec.ra.deg, [1.0, 1.0, 1.0, 11.0])
+
+        events.table.meta.update(RA_PNT=1.0, DEC_PNT=0.0)
+        assert_allclose(events.offset.deg, [0.0, 0.9, 10.0, 14.106044], rtol=1e-6)
+
+        events.table.meta["DEC_PNT"] = 10.0
+        assert_allclose(events.offset.deg[2], 0.0, atol=1e-6)
+
+    def test_cache_inplace_changes(self):
+        events = self.events.copy()
+        events.table.meta.update(MJDREFI=51910, MJDREFF=0.0, TIMESYS="tt")
+        events.table["TIME"] = [1.5, 0.1, 1.0, 0.5] * u.second
+        assert_allclose(events.radec.ra.deg, [0.0, 0.0, 0.0, 10.0])
+        met = (events.time - events.time_ref).to_value("s")
+        assert_allclose(met, [1.5, 0.1, 1.0, 0.5], rtol=1e-6)
+
+        events.table.sort("TIME")
+        assert_allclose(events.radec.ra.deg, [0.0, 10.0, 0.0, 0.0])
+        assert_allclose(events.radec.dec.deg, [0.9, 10.0, 10.0, 0.0])
+        met = (events.time - events.time_ref).to_value("s")
+        assert_allclose(met, [0.1, 0.5, 1.0, 1.5], rtol=1e-6)
+
+        events.table["RA"][0] = 99.0
+        events.table["TIME"][3] = 2.0
+        assert_allclose(events.radec.ra.deg, [99.0, 10.0, 0.0, 0.0])
+        met = (events.time - events.time_ref).to_value("s")
+        assert_allclose(met, [0.1, 0.5, 1.0, 2.0], rtol=1e-6)
+
+    def test_meta_cache(self):
+        events = self.events.copy()
+        events.table.meta.update(
+            MJDREFI=51910, MJDREFF=0.0, TSTART=0.0, TSTOP=10.0, RA_PNT=0, DEC_PNT=1
+        )
+        pointing = events.pointing_radec
+        assert events.pointing_radec is pointing
+        assert_allclose(events.observation_time_duration.to_value("s"), 10)
+
+        events.table.meta.update(TSTOP=20.0, DEC_PNT=2)
+        assert_allclose(events.pointing_radec.dec.deg, 2)
+        assert_allclose(events.observation_time_duration.to_value("s"), 20)
+
+        events.table.meta["MJDREFI"] = 51911
+        assert_allclose(events.time_ref.mjd, 51911)
+        assert_allclose(events.observation_time_start.mjd, 51911)
+
+    def test_altaz_mean(self):
+        events = self.events.copy()
+        events.table.meta.update(
+            MJDREFI=51910, MJDREFF=0.0, TSTART=0.0, TSTOP=2.0, TIMESYS="tt"
+        )
+        events.table.meta.update(GEOLON=16.5, GEOLAT=-23.27, ALTITUDE=1835.0)
+
+        altaz = events.altaz_mean
+        assert altaz.frame.obstime.shape == ()
+        assert_allclose(altaz.frame.obstime.mjd, 51910 + 1 / 86400)
+        assert_allclose(altaz.alt.deg, events.altaz.alt.deg, atol=1e-2)
+
+    def test_check_times(self):
+        events = self.events.copy()
+        events.table.meta.update(OBS_ID=1, TSTART=0.0, TSTOP=2.0)
+        assert list(events.check(checks=["times"])) == []
+
+        events.table.meta.update(TSTART=0.2, TSTOP=1.2)
+        messages = [record["msg"] for record in events.check(checks=["times"])]
+        assert messages == [
+            "Event times before obs start time",
+            "Event times after the obs end time",
+        ]
+
+    def test_galactic(self):
+        galactic = self.events.galactic
+        expected = self.events.radec.galactic
+        assert galactic.frame.name == "galactic"
+        assert_allclose(galactic.l.deg, expected.l.deg)
+        assert_allclose(galactic.b.deg, expected.b.deg, atol=1e-12)
+
+        median = self.events.galactic_median
+        assert_allclose(median.l.wrap_at("180d").deg, 99.833565, rtol=1e-6)
+        assert_allclose(median.b.deg, -56.064724, rtol=1e-6)
+
+    def test_select_row_subset(self):
+        mask = np.array([True, False, True, False])
+        events = self.events.select_row_subset(mask)
+        assert_allclose(events.table["TIME"], [0.1, 1.0])
+
+        events = self.events.select_row_subset(np.ma.MaskedArray(mask))
+        assert_allclose(events.table["TIME"], [0.1, 1.0])
+
+        with pytest.raises(IndexError):
+            self.events.select_row_subset(mask[:3])
+
+    def test_select_parameter_values(self):
+        events = self.events.select_parameter("ENERGY", [1.5, 10], is_range=False)
+        assert_allclose(events.table["TIME"], [0.5, 1.0, 1.5])
+
+        events = self.events.select_parameter("ENERGY", [np.nan, 1], is_range=False)
+        assert_allclose(events.table["TIME"], [0.1])
+
+        events = self.events.copy()
+        events.table["MULTIP"] = [2, 3, 4, 2]
+        events = events.select_parameter("MULTIP", [np.nan, 2], is_range=False)
+        assert_allclose(events.table["TIME"], [0.1, 1.5])
+
+        events = self.events.select_parameter("RA", [10] * u.deg, is_range=False)
+        assert_allclose(events.table["TIME"], [1.5])
+
+        values = [1.5, 10] * u.TeV
+        events = self.events.select_parameter("ENERGY", values, is_range=False)
+        assert_allclose(events.table["TIME"], [0.5, 1.0, 1.5])
+
+    def test_select_energy_units(self):
+        events = self.events.select_energy([1.5, 20] * u.TeV)
+        assert_allclose(events.table["TIME"], [0.5, 1.0, 1.5])
+
+        events = self.events.select_energy([1000, 1500] * u.GeV)
+        assert_allclose(events.table["TIME"], [0.1])
+
+        events = self.events.select_parameter("ENERGY", [1000, 1500] * u.GeV)
+        assert_allclose(events.table["TIME"], [0.1])
+
+    def test_map_coord(self):
+        axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+        geom = WcsGeom.create(skydir=(0, 0), width=5, frame="icrs", axes=[axis])
+        coord = self.events.map_coord(geom)
+        assert coord.frame == "icrs"
+        assert_allclose(coord.lat, [0.0, 0.9, 10.0, 10.0])
+        assert_allclose(coord["energy"].to_value("TeV"), [1.0, 1.5, 1.5, 10.0])
+
+        geom = WcsGeom.create(skydir=(0, 0), width=5, frame="galactic", axes=[axis])
+        idx = geom.coord_to_idx(self.events.map_coord(geom))
+        expected = geom.coord_to_idx(
+            {"skycoord": self.events.radec, "energy": self.events.energy}
+        )
+        assert_allclose(idx, expected)
+
+    def test_separation(self):
+        center = SkyCoord(0.0, 0.0, unit="deg", frame="galactic")
+        separation = self.events._separation(center)
+        assert separation.unit == "deg"
+        assert_allclose(separation, center.separation(self.events.radec))
+
+    @requires_dependency("numba")
+    def test_separation_compiled(self, monkeypatch):
+        import gammapy.data.event_list as event_list
+        import gammapy.utils.compilation as compilation
+
+        center = SkyCoord(10.0, 0.5, unit="deg")
+        expected = self.events._separation(center)
+
+        monkeypatch.setattr(event_list, "_SEPARATION_COMPILED_MIN_EVENTS", 1)
+        monkeypatch.setattr(
+            compilation,
+            "COMPILATION_BACKEND_DEFAULT",
+            compilation.CompilationBackendEnum.jit,
+        )
+        separation = self.events._separation(center)
+        assert separation.unit == "deg"
+        assert_allclose(separation, expected)
+
+    def test_offset2(self):
+        center = SkyCoord(10.0, 0.5, unit="deg")
+        offset2 = self.events._offset2(center)
+        assert offset2.unit == "deg2"
+        assert_allclose(offset2, center.separation(self.events.radec) ** 2)
+
+    def test_counts_image(self):
+        counts = self.events._counts_image(allsky=True)
+        expected = Map.from_geom(counts.geom)
+        expected.fill_by_coord(self.events.radec)
+        assert_allclose(counts.data, expected.smooth(width=0.5).data)
+
+    def test_select_time(self):
+        events = self.events.copy()
+        events.table.meta.update(MJDREFI=51910, MJDREFF=0.000742870370370241)
+
+        time_interval = events.time[[1, 3]]
+        selected = events.select_time(time_interval)
+        assert_allclose(selected.table["TIME"], [0.5, 1.0])
+
+        selected = events.select_time(time_interval.utc + [-0.2, 0.1] * u.s)
+        assert_allclose(selected.table["TIME"], [0.5, 1.0, 1.5])
+
+    def test_select_parameter_time(self):
+        events = self.events.copy()
+        assert events._is_time_sorted
+
+        selected = events.select_parameter("TIME", [500, 1500] * u.ms)
+        assert_allclose(selected.table["TIME"], [0.5, 1.0])
+
+        selected.table["TIME"][0] = 0.1
+        assert_allclose(events.table["TIME"][1], 0.5)
+
+        events.table["TIME"] = [1.0, 0.5, 0.1, 1.5] * u.s
+        assert not events._is_time_sorted
+
+        selected = events.select_parameter("TIME", [500, 1500] * u.ms)
+        assert_allclose(selected.table["TIME"], [1.0, 0.5])
+
+    def test_stack(self):
+        other = self.events.copy()
+        other.table.meta["OBS_ID"] = 2
+        stacked = EventList.from_stack([self.events, other])
+        assert len(stacked.table) == 8
+        assert stacked.table["ENERGY"].unit == "TeV"
+        assert stacked.table.meta["OBS_ID"] == 2
+        assert_allclose(stacked.table["RA"][4:], self.events.table["RA"])
+
+        other.table["MULTIP"] = [2, 3, 4, 2]
+        stacked = EventList.from_stack([self.events, other])
+        assert stacked.table["MULTIP"].mask.sum() == 4
+        assert_allclose(stacked.table["MULTIP"][4:], [2, 3, 4, 2])
+
+
+@pytest.fixture(scope="module")
+def hess_events_read():
+    return EventList.read(
+        "$GAMMAPY_DATA/hess-dl3-dr1/data/hess_dl3_dr1_obs_id_020136.fits.gz"
+    )
+
+
+@pytest.fixture()
+def hess_events(hess_events_read):
+    # the file is read once, each test gets its own copy
+    return hess_events_read.copy()
+
 
 @requires_data()
 class TestEventListBase:
-    def setup_class(self):
-        self.events = EventList.read(
-            "$GAMMAPY_DATA/hess-dl3-dr1/data/hess_dl3_dr1_obs_id_020136.fits.gz"
-        )
-
-    def test_select_parameter(self):
-        events = self.events.select_parameter("ENERGY", (0.8 * u.TeV, 5.0 * u.TeV))
+    def test_select_parameter(self, hess_events):
+        events = hess_events.select_parameter("ENERGY", (0.8 * u.TeV, 5.0 * u.TeV))
         assert len(events.table) == 2716
 
         with pytest.warns(UserWarning):
-            events = self.events.select_parameter(
+            events = hess_events.select_parameter(
                 "ENERGY", (0.8, 5, 10) * u.TeV, is_range=True
             )
             assert len(events.table) == 2716
 
-        events = self.events.select_parameter(
+        events = hess_events.select_parameter(
             "EVENT_ID", [1808181231761, 3594887627737, 3599182594792], is_range=False
         )
         assert len(events.table) == 3
 
-        events = self.events.select_parameter("ENERGY", (0.8, np.inf) * u.TeV)
+        events = hess_events.select_parameter("ENERGY", (0.8, np.inf) * u.TeV)
         assert len(events.table) == 3944
 
-    def test_meta(self):
-        assert self.events.meta.event_class == "std"
-        assert self.events.meta.creation.creator == "SASH FITS::EventListWriter"
-        assert self.events.meta.creation.date is None
-        assert self.events.meta.creation.origin == "H.E.S.S. Collaboration"
-        assert self.events.table["EVENT_ID"][0] == 1808181231761
+    def test_meta(self, hess_events):
+        assert hess_events.meta.event_class == "std"
+        assert hess_events.meta.creation.creator == "SASH FITS::EventListWriter"
+        assert hess_events.meta.creation.date is None
+        assert hess_events.meta.creation.origin == "H.E.S.S. Collaboration"
+        assert hess_events.table["EVENT_ID"][0] == 1808181231761
 
-    def test_write(self):
+    def test_write(self, hess_events):
         # Without GTI and pointing
-        obs = Observation(events=self.events)
+        obs = Observation(events=hess_events)
         # Write function is through obs
         with pytest.raises(ValueError):
             obs.write("test.fits.gz", include_irfs=False, overwrite=True)
 
-        pointing = FixedPointingInfo.from_fits_header(self.events.table.meta)
-        obs = Observation(events=self.events, pointing=pointing)
+        pointing = FixedPointingInfo.from_fits_header(hess_events.table.meta)
+        obs = Observation(events=hess_events, pointing=pointing)
         obs.write("test.fits.gz", include_irfs=False, overwrite=True)
         read_again = EventList.read("test.fits.gz")
 
-        assert (self.events.table == read_again.table).all()
+        assert (hess_events.table == read_again.table).all()
         assert read_again.table.meta["EXTNAME"] == "EVENTS"
         assert read_again.table.meta["HDUCLASS"] == "GADF"
         assert read_again.table.meta["HDUCLAS1"] == "EVENTS"
@@ -79,23 +316,23 @@ class TestEventListBase:
             "$GAMMAPY_DATA/hess-dl3-dr1/data/hess_dl3_dr1_obs_id_020136.fits.gz"
         )
 
-        obs = Observation(events=self.events, gti=gti, pointing=pointing)
+        obs = Observation(events=hess_events, gti=gti, pointing=pointing)
         obs.write("test.fits", overwrite=True)
         read_again_ev = EventList.read("test.fits")
         read_again_gti = GTI.read("test.fits")
 
-        assert (self.events.table == read_again_ev.table).all()
+        assert (hess_events.table == read_again_ev.table).all()
         assert gti.table.meta == read_again_gti.table.meta
         assert_allclose(gti.table["START"].mjd, read_again_gti.table["START"].mjd)
         assert_allclose(gti.table["STOP"].mjd, read_again_gti.table["STOP"].mjd)
 
         # test that it won't work if gti is not a GTI
         with pytest.raises(AttributeError):
-            obs = Observation(events=self.events, gti=gti.table, pointing=pointing)
+            obs = Observation(events=hess_events, gti=gti.table, pointing=pointing)
             obs.write("test.fits", overwrite=True)
 
-    def test_eventlist_hdu_creation_metadata(self):
-        hdu = self.events.to_table_hdu(format="gadf")
+    def test_eventlist_hdu_creation_metadata(self, hess_events):
+        hdu = hess_events.to_table_hdu(format="gadf")
         assert "CREATOR" in hdu.header
         assert "CREATED" in hdu.header
         assert hdu.header["CREATOR"] == "SASH FITS::EventListWriter"
@@ -103,28 +340,23 @@ class TestEventListBase:
 
 @requires_data()
 class TestEventListHESS:
-    def setup_class(self):
-        self.events = EventList.read(
-            "$GAMMAPY_DATA/hess-dl3-dr1/data/hess_dl3_dr1_obs_id_020136.fits.gz"
-        )
+    def test_basics(self, hess_events):
+        assert "EventList" in str(hess_events)
 
-    def test_basics(self):
-        assert "EventList" in str(self.events)
-
-        assert self.events.is_pointed_observation
+        assert hess_events.is_pointed_observation
 
-        assert len(self.events.table) == 11243
-        assert self.events.time[0].iso == "2004-03-26 02:57:47.004"
-        assert self.events.radec[0].to_string() == "229.239 -58.3417"
-        assert self.events.galactic[0].to_string(precision=2) == "321.07 -0.69"
-        assert self.events.altaz[0].to_string() == "193.338 53.258"
-        assert_allclose(self.events.offset[0].value, 0.54000974, rtol=1e-5)
+        assert len(hess_events.table) == 11243
+        assert hess_events.time[0].iso == "2004-03-26 02:57:47.004"
+        assert hess_events.radec[0].to_string() == "229.239 -58.3417"
+        assert hess_events.galactic[0].to_string(precision=2) == "321.07 -0.69"
+        assert hess_events.altaz[0].to_string() == "193.338 53.258"
+        assert_allclose(hess_events.offset[0].value, 0.54000974, rtol=1e-5)
 
-        energy = self.events.energy[0]
+        energy = hess_events.energy[0]
         assert energy.unit == "TeV"
         assert_allclose(energy.value, 0.55890286)
 
-        lon, lat, height = self.events.observatory_earth_location.to_geodetic()
+        lon, lat, height = hess_events.observatory_earth_location.to_geodetic()
         assert lon.unit == "deg"
         assert_allclose(lon.value, 16.5002222222222)
         assert lat.unit == "deg"
@@ -132,72 +364,72 @@ class TestEventListHESS:
         assert height.unit == "m"
         assert_allclose(height.value, 1835)
 
-    def test_observation_time_duration(self):
-        dt = self.events.observation_time_duration
+    def test_observation_time_duration(self, hess_events):
+        dt = hess_events.observation_time_duration
         assert dt.unit == "s"
         assert_allclose(dt.value, 1682)
 
-    def test_observation_live_time_duration(self):
-        dt = self.events.observation_live_time_duration
+    def test_observation_live_time_duration(self, hess_events):
+        dt = hess_events.observation_live_time_duration
         assert dt.unit == "s"
         assert_allclose(dt.value, 1521.026855)
 
-    def test_observation_dead_time_fraction(self):
-        deadc = self.events.observation_dead_time_fraction
+    def test_observation_dead_time_fraction(self, hess_events):
+        deadc = hess_events.observation_dead_time_fraction
         assert_allclose(deadc, 0.095703, rtol=1e-3)
 
-    def test_altaz(self):
-        altaz = self.events.altaz
+    def test_altaz(self, hess_events):
+        altaz = hess_events.altaz
         assert_allclose(altaz[0].az.deg, 193.337965, atol=1e-3)
         assert_allclose(altaz[0].alt.deg, 53.258024, atol=1e-3)
 
-    def test_median_position(self):
-        coord = self.events.galactic_median
+    def test_median_position(self, hess_events):
+        coord = hess_events.galactic_median
         assert_allclose(coord.l.deg, 320.539346, atol=1e-3)
         assert_allclose(coord.b.deg, -0.882515, atol=1e-3)
 
-    def test_median_offset(self):
-        offset_max = self.events.offset_from_median.max()
+    def test_median_offset(self, hess_events):
+        offset_max = hess_events.offset_from_median.max()
         assert_allclose(offset_max.to_value("deg"), 36.346379, atol=1e-3)
 
-    def test_from_stack(self):
-        event_lists = [self.events] * 2
+    def test_from_stack(self, hess_events):
+        event_lists = [hess_events] * 2
         stacked_list = EventList.from_stack(event_lists)
         assert len(stacked_list.table) == 11243 * 2
 
-    def test_stack(self):
-        events, other = self.events.copy(), self.events.copy()
+    def test_stack(self, hess_events):
+        events, other = hess_events.copy(), hess_events.copy()
         events.stack(other)
         assert len(events.table) == 11243 * 2
 
-    def test_offset_selection(self):
+    def test_offset_selection(self, hess_events):
         offset_range = u.Quantity([0.5, 1.0] * u.deg)
-        new_list = self.events.select_offset(offset_range)
+        new_list = hess_events.select_offset(offset_range)
         assert len(new_list.table) == 1820
 
-    def test_plot_time(self):
+    def test_plot_time(self, hess_events):
         with mpl_plot_check():
-            self.events.plot_time()
+            hess_events.plot_time()
 
-    def test_plot_energy(self):
+    def test_plot_energy(self, hess_events):
         with mpl_plot_check():
-            self.events.plot_energy()
+            hess_events.plot_energy()
 
-    def test_plot_offset2_distribution(self):
+    def test_plot_offset2_distribution(self, hess_events):
         with mpl_plot_check():
-            self.events.plot_offset2_distribution()
+            hess_events.plot_offset2_distribution()
 
-    def test_plot_energy_offset(self):
+    def test_plot_energy_offset(self, hess_events):
         with mpl_plot_check():
-            self.events.plot_energy_offset()
+            hess_events.plot_energy_offset()
 
-    def test_plot_image(self):
+    def test_plot_image(self, hess_events):
         with mpl_plot_check():
-            self.events.plot_image()
+            hess_events.plot_image()
 
-    def test_peek(self):
+    def test_peek(self, hess_events):
         with mpl_plot_check():
-            self.events.peek()
+            hess_events.peek()
 
 
 @requires_data()
@@ -258,6 +490,33 @@ class TestEventSelection:
         new_list = self.events.select_region(region_string, geom.wcs)
         assert len(new_list.table) == 1
 
+        new_list = self.events.select_region(self.on_regions[0])
+        assert_allclose(new_list.table["DEC"], [0.0, 0.9])
+
+        new_list = self.events.select_region(self.on_regions)
+        assert_allclose(new_list.table["DEC"], [0.0, 0.9, 10.0])
+
+    @pytest.mark.parametrize("radius", [0.1, 2.0, 40.0])
+    def test_region_select_circle_edge(self, radius):
+        center = SkyCoord(83.6, 22.0, unit="deg")
+        rng = np.random.default_rng(0)
+        offset = np.concatenate(
+            [rng.uniform(-1e-3, 1e-3, 500), rng.uniform(-0.2, 0, 500)]
+        )
+        separation = radius * (1 + offset)
+        position_angle = rng.uniform(0, 360, 1000)
+        positions = center.directional_offset_by(
+            position_angle * u.deg, separation * u.deg
+        )
+        table = Table({"RA": positions.ra, "DEC": positions.dec})
+        events = EventList(table)
+
+        region = CircleSkyRegion(center, radius=radius * u.deg)
+        mask = RegionGeom.from_regions(region).contains(events.radec)
+        new_list = events.select_region(region)
+        assert 0 < len(new_list.table) < len(table)
+        assert_allclose(new_list.table["RA"], table["RA"][mask])
+
     def test_map_select(self):
         axis = MapAxis.from_edges((0.5, 2.0), unit="TeV", name="ENERGY")
         geom = WcsGeom.create(
@@ -1,6 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-import astropy.io.fits as fits
 import pytest
+from numpy.testing import assert_allclose
+import astropy.io.fits as fits
+import astropy.units as u
+from astropy.table import Table
+from gammapy.data import EventList
 
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import requires_data
@@ -38,3 +42,21 @@ def test_eventlist_reader_unkwnown_format(tmpdir):
 def test_eventlist_writer_unkwnown_format():
     with pytest.raises(ValueError):
         EventListWriter().to_hdu("tmp.fits", format="unknown")
+
+
+def test_eventlist_reader_columns(tmp_path):
+    table = Table()
+    table["TIME"] = [0.1, 0.5, 1.0] * u.s
+    table["ENERGY"] = [1.0, 1.5, 10.0] * u.TeV
+    table["RA"] = [0.0, 0.1, 0.2] * u.deg
+    table.meta.update(EXTNAME="EVENTS", OBS_ID=1)
+    table.write(tmp_path / "events.fits")
+
+    events = EventListReader(columns=["ENERGY", "TIME"]).read(tmp_path / "events.fits")
+    assert events.table.colnames == ["ENERGY", "TIME"]
+    assert events.table["ENERGY"].unit == "TeV"
+    assert_allclose(events.table["TIME"], [0.1, 0.5, 1.0])
+    assert events.table.meta["OBS_ID"] == 1
+
+    events = EventList.read(tmp_path / "events.fits", memmap=False)
+    assert events.table.colnames == ["TIME", "ENERGY", "RA"]
@@ -217,6 +217,21 @@ def test_empty_observations():
     assert len(observations) == 0
 
 
+def test_observation_events_location():
+    events = HDULocation(
+        hdu_class="events", file_dir="data", file_name="run.fits", hdu_name="EVENTS"
+    )
+    obs = Observation(obs_id=1, events=events)
+
+    pointing = obs.__dict__["__pointing_hdu"]
+    assert pointing.hdu_class == "pointing"
+    assert pointing.hdu_name == "EVENTS"
+
+    meta = obs.__dict__["__meta_hdu"]
+    assert meta.hdu_class == "observation_metadata"
+    assert meta.file_name == "run.fits"
+
+
 @requires_data()
 def test_observations_str(data_store):
     obs_ids = data_store.obs_table["OBS_ID"][:4]
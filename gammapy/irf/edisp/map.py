@@ -1,5 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
+import scipy.interpolate
+from astropy import units as u
+from regions import SkyRegion
 from gammapy.maps import Map, MapAxis, MapCoord, RegionGeom, WcsGeom
 from gammapy.utils.random import InverseCDFSampler, get_random_state
 from ..core import IRFMap
@@ -9,15 +12,51 @@ __all__ = ["EDispMap", "EDispKernelMap"]
 
 
 def get_overlap_fraction(energy_axis, energy_axis_true):
-    a_min = energy_axis.edges[:-1]
-    a_max = energy_axis.edges[1:]
+    # compute on the raw values in a common unit, broadcasting (N,) against (M, 1)
+    edges_true = energy_axis_true.edges
+    edges = energy_axis.edges.to_value(edges_true.unit)
+    edges_true = edges_true.value[:, np.newaxis]
 
-    b_min = energy_axis_true.edges[:-1][:, np.newaxis]
-    b_max = energy_axis_true.edges[1:][:, np.newaxis]
+    data = np.fmin(edges[1:], edges_true[1:])
+    data -= np.fmax(edges[:-1], edges_true[:-1])
+    np.clip(data, 0, None, out=data)
+    data /= edges_true[1:] - edges_true[:-1]
+    return u.Quantity(data, "", copy=False)
 
-    xmin = np.fmin(a_max, b_max)
-    xmax = np.fmax(a_min, b_min)
-    return (np.clip(xmin - xmax, 0, np.inf) / (b_max - b_min)).to("")
+
+def _get_vector_interpolator(data, pix):
+    """Linear interpolator over the leading axes of an array.
+
+    The remaining trailing axes of ``data`` are returned as a vector for each
+    point. Axes with a single bin are not interpolated and non-finite values
+    are set to zero, as in `~gammapy.maps.Map.interp_by_pix`. Values outside
+    of the grid are extrapolated.
+
+    Parameters
+    ----------
+    data : `~numpy.ndarray`
+        Data array.
+    pix : list of `~numpy.ndarray`
+        Pixel coordinates along the leading axes of ``data``.
+
+    Returns
+    -------
+    interpolator : `~scipy.interpolate.RegularGridInterpolator`
+        Interpolator.
+    points : `~numpy.ndarray`
+        Broadcast pixel coordinates with shape ``(n_points, len(pix))``.
+    """
+    shape = data.shape[: len(pix)]
+    pix = [p if n > 1 else 0.0 for p, n in zip(pix, shape)]
+    points = np.stack(np.broadcast_arrays(*pix), axis=-1).reshape(-1, len(shape))
+
+    interpolator = scipy.interpolate.RegularGridInterpolator(
+        points=[np.arange(n, dtype=float) for n in shape],
+        values=np.where(np.isfinite(data), data, 0.0),
+        bounds_error=False,
+        fill_value=None,
+    )
+    return interpolator, points
 
 
 class EDispMap(IRFMap):
@@ -132,22 +171,30 @@ class EDispMap(IRFMap):
         geom_image = self.edisp_map.geom.to_image()
         geom = geom_image.to_cube([energy_axis, energy_axis_true])
 
-        coords = geom.get_coord(sparse=True, mode="edges", axis_name="energy")
+        # integral along migra from the interpolated cumulative sum, as in
+        # `Map.integral`. The spatial positions are the map pixel centers, so
+        # only the (energy_true, migra) combinations are interpolated.
+        cumsum = self.edisp_map.cumsum(axis_name="migra")
+        cumsum = cumsum.pad(pad_width=1, axis_name="migra", mode="edge")
+        axes = cumsum.geom.axes
 
-        migra = coords["energy"] / coords["energy_true"]
+        energy_true = energy_axis_true.center[:, np.newaxis]
+        migra = energy_axis.edges / energy_true
 
-        coords = {
-            "skycoord": coords.skycoord,
-            "energy_true": coords["energy_true"],
-            "migra": migra,
-        }
+        pix = [
+            axes["energy_true"].coord_to_pix(energy_true),
+            axes["migra"].coord_to_pix(migra),
+        ]
+        interpolator, points = _get_vector_interpolator(data=cumsum.data, pix=pix)
 
-        values = self.edisp_map.integral(axis_name="migra", coords=coords)
+        values = interpolator(points).reshape(migra.shape + cumsum.data.shape[2:])
+        values = u.Quantity(values, cumsum.unit, copy=False).to_value("")
 
         axis = self.edisp_map.geom.axes.index_data("migra")
-        data = np.clip(np.diff(values, axis=axis), 0, np.inf)
+        data = np.diff(values, axis=axis)
+        np.clip(data, 0, np.inf, out=data)
 
-        edisp_kernel_map = Map.from_geom(geom=geom, data=data.to_value(""), unit="")
+        edisp_kernel_map = Map.from_geom(geom=geom, data=data, unit="")
 
         if self.exposure_map:
             geom = geom.squash(axis_name=energy_axis.name)
@@ -180,17 +227,56 @@ class EDispMap(IRFMap):
 
         exposure_map = Map.from_geom(geom=geom.squash(axis_name="migra"), unit="m2 s")
 
-        edisp_map = Map.from_geom(geom, unit="")
         migra_axis = geom.axes["migra"]
         migra_0 = migra_axis.coord_to_pix(1)
 
-        # distribute over two pixels
-        migra = geom.get_idx()[2]
+        # distribute over two pixels, computed along the migra axis only
+        shape = [1] * len(geom.data_shape)
+        shape[geom.axes.index_data("migra")] = -1
+
+        migra = np.arange(migra_axis.nbin, dtype=float).reshape(shape)
         data = np.abs(migra - migra_0)
-        data = np.where(data < 1, 1 - data, 0)
-        edisp_map.quantity = data / migra_axis.bin_width.reshape((1, -1, 1, 1))
+        data = np.where(data < 1, 1 - data, 0) / migra_axis.bin_width.reshape(shape)
+
+        data = np.broadcast_to(data, geom.data_shape, subok=True)
+        edisp_map = Map.from_geom(geom, data=data.value.copy(), unit=data.unit)
         return cls(edisp_map, exposure_map)
 
+    def _get_migra_pdf_interpolator(self, position, energy_true):
+        """Interpolator of the PDF at the migra bin centers.
+
+        As the PDF is only needed at the migra bin centers, the interpolation
+        runs over the remaining axes and returns the PDF along the migra axis
+        as a vector for each point.
+
+        Parameters
+        ----------
+        position : `~astropy.coordinates.SkyCoord`
+            Positions of the events.
+        energy_true : `~astropy.units.Quantity`
+            True energies of the events.
+
+        Returns
+        -------
+        interpolator : `~scipy.interpolate.RegularGridInterpolator`
+            Interpolator returning the PDF with shape ``(n_points, n_migra)``.
+        points : `~numpy.ndarray`
+            Pixel coordinates of the events with shape ``(n_events, n_axes)``.
+        """
+        geom = self.edisp_map.geom
+        coords = {
+            "skycoord": position,
+            "energy_true": energy_true,
+            "migra": geom.axes["migra"].center[0],
+        }
+        pix = list(geom.coord_to_pix(coords)[::-1])
+
+        axis = geom.axes.index_data("migra")
+        del pix[axis]
+
+        data = np.moveaxis(self.edisp_map.data, axis, -1)
+        return _get_vector_interpolator(data=data, pix=pix)
+
     def sample_coord(self, map_coord, random_state=0, chunk_size=10000):
         """Apply the energy dispersion corrections on the coordinates of a set of simulated events.
 
@@ -218,29 +304,39 @@ class EDispMap(IRFMap):
         energy_true = map_coord["energy_true"]
 
         size = position.size
-        energy_reco = np.ones(size) * map_coord["energy_true"].unit
+        energy_true_value = energy_true.value
+        energy_reco = np.empty(size)
         chunk_size = size if chunk_size is None else chunk_size
         index = 0
 
+        interpolator, points = self._get_migra_pdf_interpolator(
+            position=position, energy_true=energy_true
+        )
+
+        # sampled pixels lie within the axis edges, where a linear axis is
+        # piecewise linear between the edge and center pixels
+        is_linear = migra_axis.interp == "lin"
+        if is_linear:
+            pix_table = np.arange(-0.5, migra_axis.nbin, 0.5)
+            migra_table = migra_axis.pix_to_coord(pix_table).to_value("")
+
         while index < size:
             chunk = slice(index, index + chunk_size, 1)
-            coord = {
-                "skycoord": position[chunk].reshape(-1, 1),
-                "energy_true": energy_true[chunk].reshape(-1, 1),
-                "migra": migra_axis.center,
-            }
-
-            pdf_edisp = self.edisp_map.interp_by_coord(coord)
+            pdf_edisp = interpolator(points[chunk])
 
             sample_edisp = InverseCDFSampler(
                 pdf_edisp, axis=1, random_state=random_state
             )
             pix_edisp = sample_edisp.sample_axis()
-            migra = migra_axis.pix_to_coord(pix_edisp)
+            if is_linear:
+                migra = np.interp(pix_edisp, pix_table, migra_table)
+            else:
+                migra = migra_axis.pix_to_coord(pix_edisp).to_value("")
 
-            energy_reco[chunk] = energy_true[chunk] * migra
+            np.multiply(energy_true_value[chunk], migra, out=energy_reco[chunk])
             index += chunk_size
 
+        energy_reco = u.Quantity(energy_reco, energy_true.unit, copy=False)
         return MapCoord.create({"skycoord": position, "energy": energy_reco})
 
     @classmethod
@@ -350,10 +446,11 @@ class EDispKernelMap(IRFMap):
         energy_axis = geom.axes["energy"]
         energy_axis_true = geom.axes["energy_true"]
 
-        data = get_overlap_fraction(energy_axis, energy_axis_true)
+        data = get_overlap_fraction(energy_axis, energy_axis_true).value
 
-        edisp_kernel_map = Map.from_geom(geom, unit="")
-        edisp_kernel_map.quantity += np.resize(data, geom.data_shape_axes)
+        # duplicate the kernel over the spatial bins in a single copy
+        data = np.broadcast_to(data[..., np.newaxis, np.newaxis], geom.data_shape)
+        edisp_kernel_map = Map.from_geom(geom, data=data.astype("float32"), unit="")
         return cls(edisp_kernel_map=edisp_kernel_map, exposure_map=exposure)
 
     def get_edisp_kernel(self, position=None, energy_axis=None):
@@ -376,19 +473,49 @@ class EDispKernelMap(IRFMap):
         if energy_axis:
             assert energy_axis == self.edisp_map.geom.axes["energy"]
 
-        if isinstance(self.edisp_map.geom, RegionGeom):
-            kernel_map = self.edisp_map
+        geom = self.edisp_map.geom
+
+        if isinstance(geom, RegionGeom):
+            data = self.edisp_map.data[..., 0, 0]
+        elif isinstance(geom, WcsGeom) and not isinstance(position, SkyRegion):
+            data = self._get_edisp_kernel_data_nearest(position)
         else:
             if position is None:
-                position = self.edisp_map.geom.center_skydir
+                position = geom.center_skydir
             position = self._get_nearest_valid_position(position)
 
             kernel_map = self.edisp_map.to_region_nd_map(region=position)
+            data = kernel_map.data[..., 0, 0]
 
-        return EDispKernel(
-            axes=kernel_map.geom.axes[["energy_true", "energy"]],
-            data=kernel_map.data[..., 0, 0],
-        )
+        return EDispKernel(axes=geom.axes[["energy_true", "energy"]], data=data)
+
+    def _get_edisp_kernel_data_nearest(self, position=None):
+        """Get the kernel data of the spatial pixel nearest to a position.
+
+        Equivalent to nearest neighbour interpolation with
+        `~gammapy.maps.Map.to_region_nd_map`, but only reads the data of the
+        spatial pixels needed for the validity check and the kernel.
+        """
+        geom = self.edisp_map.geom.to_image()
+        data = self.edisp_map.data
+
+        if position is None:
+            position = geom.center_skydir
+
+        idx_x, idx_y = geom.coord_to_idx(position)
+        is_valid = idx_x >= 0 and idx_y >= 0 and np.any(data[..., idx_y, idx_x] > 0)
+
+        if not is_valid:
+            position = self._get_nearest_valid_position(position)
+
+        # nearest pixel, with the same rounding and clipping as the
+        # nearest neighbour interpolation
+        idx = []
+        for pix, npix in zip(geom.coord_to_pix(position), geom.data_shape[::-1]):
+            idx.append(int(np.clip(np.ceil(pix - 0.5), 0, npix - 1)))
+
+        kernel = data[..., idx[1], idx[0]]
+        return np.where(np.isfinite(kernel), kernel, 0)
 
     @classmethod
     def from_diagonal_response(cls, energy_axis, energy_axis_true, geom=None):
@@ -409,14 +536,18 @@ class EDispKernelMap(IRFMap):
         edisp_map : `EDispKernelMap`
             Energy dispersion kernel map.
         """
+        geom = cls._get_kernel_geom(energy_axis, energy_axis_true, geom=geom)
+        return cls.from_geom(geom)
+
+    @staticmethod
+    def _get_kernel_geom(energy_axis, energy_axis_true, geom=None):
+        """Kernel map geometry, all sky with 2 bins if no (2D) geometry is given."""
         if geom is None:
-            geom = WcsGeom.create(
+            return WcsGeom.create(
                 npix=(2, 1), proj="CAR", binsz=180, axes=[energy_axis, energy_axis_true]
             )
-        else:
-            geom = geom.to_image().to_cube([energy_axis, energy_axis_true])
 
-        return cls.from_geom(geom)
+        return geom.to_image().to_cube([energy_axis, energy_axis_true])
 
     @classmethod
     def from_edisp_kernel(cls, edisp, geom=None):
@@ -437,14 +568,16 @@ class EDispKernelMap(IRFMap):
         edisp_map : `EDispKernelMap`
             Energy dispersion kernel map.
         """
-        edisp_map = cls.from_diagonal_response(
+        geom = cls._get_kernel_geom(
             edisp.axes["energy"], edisp.axes["energy_true"], geom=geom
         )
-        edisp_map.edisp_map.data *= 0
-        edisp_map.edisp_map.data[:, :, ...] = edisp.pdf_matrix[
-            :, :, np.newaxis, np.newaxis
-        ]
-        return edisp_map
+        exposure = Map.from_geom(geom.squash(axis_name="energy"), unit="m2 s")
+
+        # duplicate the kernel over the spatial bins in a single copy
+        data = edisp.pdf_matrix[..., np.newaxis, np.newaxis]
+        data = np.broadcast_to(data, geom.data_shape).astype("float32")
+        edisp_kernel_map = Map.from_geom(geom, data=data, unit="")
+        return cls(edisp_kernel_map=edisp_kernel_map, exposure_map=exposure)
 
     @classmethod
     def from_gauss(
@@ -498,10 +631,16 @@ class EDispKernelMap(IRFMap):
             Energy dispersion kernel map.
         """
         edisp = self.edisp_map.data
-        if weights:
-            edisp = edisp * weights.data
 
-        data = np.sum(edisp, axis=1, keepdims=True)
+        if weights and weights.data.shape == edisp.shape:
+            # weighted sum in a single pass, without the product temporary
+            data = np.einsum("ij...,ij...->i...", edisp, weights.data)
+            data = data[:, np.newaxis]
+        else:
+            if weights:
+                edisp = edisp * weights.data
+
+            data = np.sum(edisp, axis=1, keepdims=True)
         geom = self.edisp_map.geom.squash(axis_name="energy")
         edisp_map = Map.from_geom(geom=geom, data=data)
         return self.__class__(
@@ -13,7 +13,7 @@ from gammapy.irf import (
     EnergyDispersion2D,
 )
 from gammapy.makers.utils import make_edisp_map, make_map_exposure_true_energy
-from gammapy.maps import MapAxis, MapCoord, RegionGeom, WcsGeom
+from gammapy.maps import Map, MapAxis, MapCoord, RegionGeom, WcsGeom
 from gammapy.utils.testing import mpl_plot_check, requires_data
 from gammapy.utils.scripts import make_path
 
@@ -225,6 +225,36 @@ def test_edisp_kernel_map_stack():
     assert_allclose(exposure, 3.0)
 
 
+def test_edisp_kernel_map_get_edisp_kernel_nearest():
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.5 TeV", "20 TeV", nbin=4, name="energy_true"
+    )
+    geom = WcsGeom.create(skydir=(0, 0), npix=5, binsz=1, frame="galactic")
+    edisp = EDispKernelMap.from_diagonal_response(
+        energy_axis, energy_axis_true, geom=geom
+    )
+    edisp.edisp_map.data *= np.arange(1, 26).reshape((5, 5))
+    edisp.edisp_map.data[..., :2, :] = 0
+
+    positions = [
+        None,
+        SkyCoord(0.4, 1.6, unit="deg", frame="galactic"),
+        SkyCoord(0, 0, unit="deg", frame="galactic"),
+        SkyCoord(10, -10, unit="deg", frame="galactic"),
+    ]
+
+    for position in positions:
+        kernel = edisp.get_edisp_kernel(position=position)
+
+        if position is None:
+            position = geom.center_skydir
+
+        position_valid = edisp._get_nearest_valid_position(position)
+        expected = edisp.edisp_map.to_region_nd_map(region=position_valid)
+        assert_allclose(kernel.data, expected.data[..., 0, 0])
+
+
 def test_incorrect_edisp_kernel_map_stack():
     energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=5)
 
@@ -300,6 +330,17 @@ def test_edisp_kernel_map_to_image():
     assert im.edisp_map.data.shape == (5, 1, 1, 2)
     assert_allclose(im.edisp_map.data[0, 0, 0, 0], 0.87605894, rtol=1e-5)
 
+    weights = Map.from_geom(edisp.edisp_map.geom, dtype=bool)
+    weights.data[:, 1:] = True
+    im = edisp.to_image(weights=weights)
+    expected = edisp.edisp_map.data[:, 1:].sum(axis=1)
+    assert_allclose(im.edisp_map.data[:, 0], expected)
+
+    weights = Map.from_geom(edisp.edisp_map.geom.squash("energy_true"), dtype=bool)
+    weights.data[:, 1:] = True
+    im = edisp.to_image(weights=weights)
+    assert_allclose(im.edisp_map.data[:, 0], expected)
+
 
 def test_edisp_kernel_map_resample_axis():
     e_reco = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=4)
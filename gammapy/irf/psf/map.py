@@ -363,7 +363,7 @@ class PSFMap(IRFMap):
         energy = map_coord[self.energy_name]
 
         size = position.size
-        separation = np.ones(size) * u.deg
+        separation = u.Quantity(np.empty(size), rad_axis.unit, copy=False)
         chunk_size = size if chunk_size is None else chunk_size
 
         index = 0
@@ -1344,16 +1344,19 @@ class restore_models_status:
     def __init__(self, models, restore_values=True):
         self.restore_values = restore_values
         self.models = models
-        self.values = [_.value for _ in models.parameters]
-        self.frozen = [_.frozen for _ in models.parameters]
+        parameters = models.parameters
+        self.values = [_._value for _ in parameters]
+        self.frozen = [_._frozen for _ in parameters]
         self.covariance_data = models.covariance.data
 
     def __enter__(self):
         pass
 
     def __exit__(self, type, value, traceback):
+        # only go through the setters for the parameters that changed
         for value, par, frozen in zip(self.values, self.models.parameters, self.frozen):
-            if self.restore_values:
+            if self.restore_values and par._value != value:
                 par.value = value
-            par.frozen = frozen
+            if par._frozen != frozen:
+                par.frozen = frozen
         self.models.covariance = self.covariance_data
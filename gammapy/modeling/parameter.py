@@ -6,10 +6,11 @@ import copy
 import html
 import itertools
 import logging
+import math
 import numpy as np
 from astropy import units as u
 from astropy.table import Table
-from gammapy.utils.interpolation import interpolation_scale
+from gammapy.utils.interpolation import LogScale, interpolation_scale
 from gammapy.utils.scripts import make_name
 
 
@@ -18,6 +19,92 @@ __all__ = ["Parameter", "Parameters", "PriorParameter", "PriorParameters"]
 log = logging.getLogger(__name__)
 
 
+class _LinearTransform:
+    """Linear parameter transform on Python floats."""
+
+    @staticmethod
+    def forward(value):
+        return value
+
+    @staticmethod
+    def inverse(value):
+        return value
+
+    @staticmethod
+    def inverse_derivative(value):
+        return 1.0
+
+
+class _LogTransform:
+    """Logarithmic parameter transform on Python floats, as `LogScale`."""
+
+    @staticmethod
+    def forward(value):
+        return math.log(max(value, LogScale.tiny))
+
+    @staticmethod
+    def inverse(value):
+        try:
+            output = math.exp(value)
+        except OverflowError:
+            return math.inf
+        return 0.0 if output - LogScale.tiny <= LogScale.tiny else output
+
+    inverse_derivative = inverse
+
+
+class _SqrtTransform:
+    """Square root parameter transform on Python floats, as `SqrtScale`."""
+
+    @staticmethod
+    def forward(value):
+        return math.copysign(math.sqrt(abs(value)), value)
+
+    @staticmethod
+    def inverse(value):
+        return value * value
+
+    @staticmethod
+    def inverse_derivative(value):
+        return 2.0 * value
+
+
+_IMMUTABLE_TYPES = (bool, int, float, str, type(None), type, u.UnitBase)
+
+_UNIT_CACHE = {}
+
+
+def _to_unit(val):
+    """Convert to `~astropy.units.Unit`, caching units parsed from strings."""
+    if not isinstance(val, str):
+        return u.Unit(val)
+
+    unit = _UNIT_CACHE.get(val)
+    if unit is None:
+        unit = _UNIT_CACHE[val] = u.Unit(val)
+    return unit
+
+
+def _split_quantity(value):
+    """Split a `~astropy.units.Quantity` or a string like "1 TeV" into value and unit."""
+    if isinstance(value, u.Quantity):
+        return value.value, value.unit
+
+    number, _, unit = value.strip().partition(" ")
+    try:
+        return float(number), _to_unit(unit)
+    except ValueError:
+        value = u.Quantity(value)
+        return value.value, value.unit
+
+
+_SCALAR_TRANSFORMS = {
+    "lin": _LinearTransform,
+    "log": _LogTransform,
+    "sqrt": _SqrtTransform,
+}
+
+
 def _get_parameters_str(parameters):
     str_ = ""
 
@@ -128,7 +215,7 @@ class Parameter:
         self._name = name
         self._link_label_io = None
         self._scale_method = scale_method
-        self._scale_transform = scale_transform
+        self._set_scale_transform(scale_transform)
         self.interp = interp
         self._scale = float(scale)
         self.frozen = frozen
@@ -137,10 +224,8 @@ class Parameter:
 
         # TODO: move this to a setter method that can be called from `__set__` also!
         # Having it here is bad: behaviour not clear if Quantity and `unit` is passed.
-        if isinstance(value, u.Quantity) or isinstance(value, str):
-            val = u.Quantity(value)
-            self.value = val.value
-            self.unit = val.unit
+        if isinstance(value, (u.Quantity, str)):
+            self.value, self.unit = _split_quantity(value)
         else:
             self.value = float(value)
             self.unit = unit
@@ -223,7 +308,11 @@ class Parameter:
     @factor.setter
     def factor(self, val):
         self._factor = float(val)
-        self._value = float(self.inverse_transform(self._factor))
+
+        if self._scalar_transform is _LinearTransform:
+            self._value = self._scale * self._factor
+        else:
+            self._value = float(self.inverse_transform(self._factor))
 
     @property
     def scale(self):
@@ -237,7 +326,15 @@ class Parameter:
 
     @unit.setter
     def unit(self, val):
-        self._unit = u.Unit(val)
+        self._unit = _to_unit(val)
+        self._unit_string = None
+
+    @property
+    def _unit_fits_string(self):
+        """Unit as a FITS string, cached as formatting units is slow."""
+        if self._unit_string is None:
+            self._unit_string = self.unit.to_string("fits")
+        return self._unit_string
 
     @property
     def min(self):
@@ -247,7 +344,7 @@ class Parameter:
     @min.setter
     def min(self, val):
         """`~astropy.table.Table` has masked values for NaN. Replacing with NaN."""
-        if isinstance(val, np.ma.core.MaskedConstant) or (val is None):
+        if val is None or val is np.ma.masked:
             self._min = np.nan
         else:
             self._min = self._set_quantity_str_float(val)
@@ -269,7 +366,7 @@ class Parameter:
     @max.setter
     def max(self, val):
         """`~astropy.table.Table` has masked values for NaN. Replacing with NaN."""
-        if isinstance(val, np.ma.core.MaskedConstant) or (val is None):
+        if val is None or val is np.ma.masked:
             self._max = np.nan
         else:
             self._max = self._set_quantity_str_float(val)
@@ -285,9 +382,11 @@ class Parameter:
 
     def _set_quantity_str_float(self, value):
         """Logics for min and max setter."""
-        if isinstance(value, u.Quantity) or isinstance(value, str):
+        if type(value) is float:
+            return value
+        elif isinstance(value, (u.Quantity, str)):
             value = u.Quantity(value)
-            return float(value.to(self.unit).value)
+            return float(value.to(self._unit).value)
         else:
             return float(value)
 
@@ -328,7 +427,12 @@ class Parameter:
         if val not in ["lin", "log", "sqrt"]:
             raise ValueError(f"Invalid transform: {val}")
         self.reset_autoscale()
+        self._set_scale_transform(val)
+
+    def _set_scale_transform(self, val):
         self._scale_transform = val
+        self._interp_scale = interpolation_scale(val)
+        self._scalar_transform = _SCALAR_TRANSFORMS[val]
 
     @property
     def frozen(self):
@@ -351,7 +455,11 @@ class Parameter:
     @value.setter
     def value(self, val):
         self._value = float(val)
-        self._factor = self.transform(val)
+
+        if self._scalar_transform is _LinearTransform and self._scale != 0:
+            self._factor = self._value / self._scale
+        else:
+            self._factor = self.transform(self._value)
 
     @property
     def quantity(self):
@@ -372,7 +480,7 @@ class Parameter:
 
     @property
     def _step(self):
-        return self.error if self.error > 0.0 else np.abs(self.value)
+        return self._error if self._error > 0.0 else abs(self._value)
 
     # TODO: possibly allow to set this independently
     @property
@@ -380,13 +488,13 @@ class Parameter:
         """Confidence minimum value as a `float`.
         Return parameter minimum if defined, otherwise  a default is estimated from value and error.
         """
-        if not np.isnan(self.min):
-            return self.min
+        if not math.isnan(self._min):
+            return self._min
         else:
-            min_ = self.value - self._step * self.scan_n_sigma
-            large_step = np.maximum(self._step, np.abs(self.value))
-            min_ = np.minimum(min_, -large_step * 1e5)
-            return min_
+            step = self._step
+            min_ = self._value - step * self.scan_n_sigma
+            large_step = max(step, abs(self._value))
+            return min(min_, -large_step * 1e5)
 
     # TODO: possibly allow to set this independently
     @property
@@ -395,13 +503,13 @@ class Parameter:
         Return parameter maximum if defined, otherwise a default is estimated from value and error.
         """
 
-        if not np.isnan(self.max):
-            return self.max
+        if not math.isnan(self._max):
+            return self._max
         else:
-            max_ = self.value + self._step * self.scan_n_sigma
-            large_step = np.maximum(self._step, np.abs(self.value))
-            max_ = np.maximum(max_, large_step * 1e5)
-            return max_
+            step = self._step
+            max_ = self._value + step * self.scan_n_sigma
+            large_step = max(step, abs(self._value))
+            return max(max_, large_step * 1e5)
 
     @property
     def scan_min(self):
@@ -479,6 +587,18 @@ class Parameter:
         except AttributeError:
             return f"<pre>{html.escape(str(self))}</pre>"
 
+    def __deepcopy__(self, memo):
+        # only copy the mutable attributes, most are floats or strings
+        new = object.__new__(self.__class__)
+        memo[id(self)] = new
+
+        for key, value in self.__dict__.items():
+            if not isinstance(value, _IMMUTABLE_TYPES):
+                value = copy.deepcopy(value, memo)
+            new.__dict__[key] = value
+
+        return new
+
     def copy(self):
         """Deep copy."""
         return copy.deepcopy(self)
@@ -496,7 +616,7 @@ class Parameter:
         output = {
             "name": self.name,
             "value": self.value,
-            "unit": self.unit.to_string("fits"),
+            "unit": self._unit_fits_string,
             "error": self.error,
             "min": self.min,
             "max": self.max,
@@ -529,9 +649,12 @@ class Parameter:
 
         """
         if self.scale_method == "scale10":
-            if value != 0:
-                exponent = np.floor(np.log10(np.abs(value)))
-                self._scale = np.power(10.0, exponent)
+            if value != 0 and math.isfinite(value):
+                exponent = math.floor(math.log10(abs(value)))
+                self._scale = 10.0**exponent
+            elif value != 0:
+                # nan or inf
+                self._scale = abs(value)
 
         elif self.scale_method == "factor1":
             self._scale = value
@@ -546,11 +669,16 @@ class Parameter:
         update_scale : bool, optional
             Update the scaling (used by the autoscale). Default is False.
         """
-        interp_scale = interpolation_scale(self.scale_transform)
-        transformed_value = interp_scale(value)
+        if isinstance(value, float):
+            transformed_value = self._scalar_transform.forward(value)
+        else:
+            transformed_value = self._interp_scale(value)
         if update_scale:
             self.update_scale(transformed_value)
-        return transformed_value / self.scale
+        if self._scale == 0:
+            # same result as for arrays, nan or inf instead of ZeroDivisionError
+            return np.divide(transformed_value, self._scale)
+        return transformed_value / self._scale
 
     def inverse_transform(self, factor):
         """Inverse transform from factor (used by the optimizer) to value.
@@ -560,9 +688,11 @@ class Parameter:
         factor : float
             Parameter factor.
         """
-        interp_scale = interpolation_scale(self.scale_transform)
-        value = interp_scale.inverse(self.scale * factor)
-        return value
+        value = self.scale * factor
+
+        if isinstance(value, float):
+            return self._scalar_transform.inverse(value)
+        return self._interp_scale.inverse(value)
 
     def _inverse_transform_derivative(self, factor):
         """Inverse transform from factor (used by the optimizer) to value.
@@ -572,8 +702,13 @@ class Parameter:
         factor : float
             Parameter factor.
         """
-        interp_scale = interpolation_scale(self.scale_transform)
-        return interp_scale._inverse_deriv(self.scale * factor) * self.scale
+        value = self.scale * factor
+
+        if isinstance(value, float):
+            derivative = self._scalar_transform.inverse_derivative(value)
+        else:
+            derivative = self._interp_scale._inverse_deriv(value)
+        return derivative * self.scale
 
     def autoscale(self):
         "Apply `~gammapy.utils.interpolation.interpolation_scale` and `scale_method` to the parameter."
@@ -613,8 +748,15 @@ class Parameters(collections.abc.Sequence):
 
     def check_limits(self):
         """Check parameter limits and emit a warning."""
-        for par in self:
-            par.check_limits()
+        frozen = np.fromiter(
+            (_._frozen for _ in self._parameters), dtype=bool, count=len(self)
+        )
+        value = self.value
+        # comparisons with nan limits are False
+        outside = ~frozen & ((value < self.min) | (value > self.max))
+
+        for idx in np.flatnonzero(outside):
+            self._parameters[idx].check_limits()
 
     @property
     def prior(self):
@@ -635,7 +777,9 @@ class Parameters(collections.abc.Sequence):
     @property
     def min(self):
         """Parameter minima as a `numpy.ndarray`."""
-        return np.array([_.min for _ in self._parameters], dtype=np.float64)
+        return np.fromiter(
+            (_._min for _ in self._parameters), dtype=np.float64, count=len(self)
+        )
 
     @min.setter
     def min(self, min_array):
@@ -649,7 +793,9 @@ class Parameters(collections.abc.Sequence):
     @property
     def max(self):
         """Parameter maxima as a `numpy.ndarray`."""
-        return np.array([_.max for _ in self._parameters], dtype=np.float64)
+        return np.fromiter(
+            (_._max for _ in self._parameters), dtype=np.float64, count=len(self)
+        )
 
     @max.setter
     def max(self, max_array):
@@ -663,7 +809,9 @@ class Parameters(collections.abc.Sequence):
     @property
     def value(self):
         """Parameter values as a `numpy.ndarray`."""
-        return np.array([_.value for _ in self._parameters], dtype=np.float64)
+        return np.fromiter(
+            (_._value for _ in self._parameters), dtype=np.float64, count=len(self)
+        )
 
     @value.setter
     def value(self, values):
@@ -693,7 +841,7 @@ class Parameters(collections.abc.Sequence):
     @property
     def free_parameters(self):
         """List of free parameters."""
-        return self.__class__([par for par in self._parameters if not par.frozen])
+        return self.__class__([par for par in self._parameters if not par._frozen])
 
     @property
     def unique_parameters(self):
@@ -703,7 +851,9 @@ class Parameters(collections.abc.Sequence):
     @property
     def free_unique_parameters(self):
         """List of free and unique parameters."""
-        return self.__class__([par for par in self.unique_parameters if not par.frozen])
+        return self.__class__(
+            [par for par in dict.fromkeys(self._parameters) if not par._frozen]
+        )
 
     @property
     def names(self):
@@ -731,11 +881,19 @@ class Parameters(collections.abc.Sequence):
     def __getitem__(self, key):
         """Access parameter by name, index or boolean mask."""
         if isinstance(key, np.ndarray) and key.dtype == bool:
-            return self.__class__(list(np.array(self._parameters)[key]))
+            if key.shape != (len(self),):
+                raise IndexError(
+                    f"Boolean mask of shape {key.shape} does not match "
+                    f"{len(self)} parameters"
+                )
+            return self.__class__(itertools.compress(self._parameters, key))
         else:
             idx = self.index(key)
             return self._parameters[idx]
 
+    def __iter__(self):
+        return iter(self._parameters)
+
     def __len__(self):
         return len(self._parameters)
 
@@ -771,16 +929,10 @@ class Parameters(collections.abc.Sequence):
 
     def update_link_label(self):
         """Update linked parameters labels used for serialisation and print."""
-        params_list = []
-        params_shared = []
-        for param in self:
-            if param not in params_list:
-                params_list.append(param)
-                params_list.append(param)
-            elif param not in params_shared:
-                params_shared.append(param)
-        for param in params_shared:
-            param._link_label_io = param.name + "@" + make_name()
+        counts = collections.Counter(self._parameters)
+        for param, count in counts.items():
+            if count > 1:
+                param._link_label_io = param.name + "@" + make_name()
 
     def to_table(self):
         """Convert parameter attributes to `~astropy.table.Table`."""
@@ -800,8 +952,9 @@ class Parameters(collections.abc.Sequence):
         return table
 
     def __eq__(self, other):
-        all_equal = np.all([p is p_new for p, p_new in zip(self, other)])
-        return all_equal and len(self) == len(other)
+        return len(self) == len(other) and all(
+            p is p_new for p, p_new in zip(self, other)
+        )
 
     @classmethod
     def from_dict(cls, data):
@@ -821,9 +974,11 @@ class Parameters(collections.abc.Sequence):
 
         Used in the optimizer interface.
         """
+        factors = np.asarray(factors, dtype=np.float64).tolist()
+
         idx = 0
         for parameter in self._parameters:
-            if not parameter.frozen:
+            if not parameter._frozen:
                 parameter.factor = factors[idx]
                 idx += 1
 
@@ -860,21 +1015,24 @@ class Parameters(collections.abc.Sequence):
         """
         selection = np.ones(len(self), dtype=bool)
 
-        if name and not isinstance(name, list):
-            name = [name]
-
-        for idx, par in enumerate(self):
-            if name:
-                selection[idx] &= np.any([_ == par.name for _ in name])
-
-            if type:
-                selection[idx] &= type == par.type
+        if name:
+            if not isinstance(name, list):
+                name = [name]
+            names = [par.name for par in self._parameters]
+            selection &= np.isin(np.array(names, dtype=object), name)
+
+        if type:
+            selection &= np.fromiter(
+                (par.type == type for par in self._parameters),
+                dtype=bool,
+                count=len(self),
+            )
 
-            if frozen is not None:
-                if frozen:
-                    selection[idx] &= par.frozen
-                else:
-                    selection[idx] &= ~par.frozen
+        if frozen is not None:
+            is_frozen = np.fromiter(
+                (par._frozen for par in self._parameters), dtype=bool, count=len(self)
+            )
+            selection &= is_frozen if frozen else ~is_frozen
 
         return self[selection]
 
@@ -914,17 +1072,19 @@ class restore_parameters_status:
     def __init__(self, parameters, restore_values=True):
         self.restore_values = restore_values
         self._parameters = parameters
-        self.values = [_.value for _ in parameters]
-        self.frozen = [_.frozen for _ in parameters]
+        self.values = [_._value for _ in parameters]
+        self.frozen = [_._frozen for _ in parameters]
 
     def __enter__(self):
         pass
 
     def __exit__(self, type, value, traceback):
+        # only go through the setters for the parameters that changed
         for value, par, frozen in zip(self.values, self._parameters, self.frozen):
-            if self.restore_values:
+            if self.restore_values and par._value != value:
                 par.value = value
-            par.frozen = frozen
+            if par._frozen != frozen:
+                par.frozen = frozen
 
 
 class PriorParameter(Parameter):
@@ -965,15 +1125,13 @@ class PriorParameter(Parameter):
 
         self._name = name
         self._scale_method = scale_method
-        self._scale_transform = scale_transform
+        self._set_scale_transform(scale_transform)
         self._scale = float(scale)
         self.min = min
         self.max = max
         self._error = error
-        if isinstance(value, u.Quantity) or isinstance(value, str):
-            val = u.Quantity(value)
-            self.value = val.value
-            self.unit = val.unit
+        if isinstance(value, (u.Quantity, str)):
+            self.value, self.unit = _split_quantity(value)
         else:
             self.factor = value
             self.unit = unit
@@ -985,7 +1143,7 @@ class PriorParameter(Parameter):
         output = {
             "name": self.name,
             "value": self.value,
-            "unit": self.unit.to_string("fits"),
+            "unit": self._unit_fits_string,
             "error": self.error,
             "min": self.min,
             "max": self.max,
@@ -1021,15 +1179,23 @@ class PriorParameters(Parameters):
 
     def to_table(self):
         """Convert parameter attributes to `~astropy.table.Table`."""
-        rows = []
-        for p in self._parameters:
-            d = p.to_dict()
-            rows.append({**dict(type=p.type), **d})
-        table = Table(rows)
+        parameters = self._parameters
+        table = Table(
+            {
+                "type": np.array([p.type for p in parameters], dtype=str),
+                "name": np.array([p.name for p in parameters], dtype=str),
+                "value": np.array([p.value for p in parameters], dtype=float),
+                "unit": np.array([p._unit_fits_string for p in parameters], dtype=str),
+                "error": np.array([p.error for p in parameters], dtype=float),
+                "min": np.array([p.min for p in parameters], dtype=float),
+                "max": np.array([p.max for p in parameters], dtype=float),
+            }
+        )
 
-        table["value"].format = ".4e"
-        for name in ["error", "min", "max"]:
-            table[name].format = ".3e"
+        if len(table):
+            table["value"].format = ".4e"
+            for name in ["error", "min", "max"]:
+                table[name].format = ".3e"
 
         return table
 
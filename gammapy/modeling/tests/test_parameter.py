@@ -52,6 +52,23 @@ def test_parameter_outside_limit(caplog):
     assert message1 in [_.message for _ in caplog.records]
 
 
+def test_parameters_outside_limit(caplog):
+    pars = Parameters(
+        [
+            Parameter("spam", 50, min=0, max=40),
+            Parameter("ham", -1, min=0, frozen=True),
+            Parameter("egg", 1),
+            Parameter("bacon", -1, max=-2),
+        ]
+    )
+    pars.check_limits()
+    messages = [_.message for _ in caplog.records]
+    assert messages == [
+        "Value 50.0 is outside bounds [0.0, 40.0] for parameter 'spam'",
+        "Value -1.0 is outside bounds [nan, -2.0] for parameter 'bacon'",
+    ]
+
+
 def test_parameter_scale():
     # Basic check how scale is used for value, min, max
     par = Parameter("spam", 420, "deg", 10, 400, 500)
@@ -151,6 +168,35 @@ def test_parameter_scale_transform_change():
         par.scale_transform = "invalid"
 
 
+@pytest.mark.parametrize("scale_transform", ["lin", "log", "sqrt"])
+def test_parameter_scale_transform_scalar(scale_transform):
+    par = Parameter("", 1, scale_method=None, scale_transform=scale_transform)
+    values = np.array([-2.5, 0.0, 1e-3, 3.0, 1e5])
+
+    actual = [par.transform(value) for value in values]
+    assert_allclose(actual, par.transform(values), rtol=1e-15)
+
+    actual = [par.inverse_transform(value) for value in values]
+    assert_allclose(actual, par.inverse_transform(values), rtol=1e-15)
+
+    actual = [par._inverse_transform_derivative(value) for value in values]
+    expected = par._inverse_transform_derivative(values) * np.ones_like(values)
+    assert_allclose(actual, expected, rtol=1e-15)
+
+    par = Parameter("", 0.0, scale_method="factor1", scale_transform=scale_transform)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        par.autoscale()
+        actual = [par.transform(value) for value in values]
+        assert_allclose(actual, par.transform(values), rtol=1e-15)
+    if scale_transform != "log":
+        assert par.scale == 0
+        assert np.isnan(par.factor)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        par.value = 2.0
+        assert_equal(par.factor, par.transform(2.0))
+
+
 @pytest.fixture()
 def pars():
     return Parameters(
@@ -402,6 +448,16 @@ def test_priorparameter_init():
     assert par.max is np.nan
 
 
+@pytest.mark.parametrize(
+    "value", ["42 deg", " 1e-12  cm-2 s-1 TeV-1", "1TeV", "-2", "inf TeV", "1 2 TeV"]
+)
+def test_priorparameter_init_str(value):
+    par = PriorParameter("spam", value)
+    expected = u.Quantity(value)
+    assert_equal(par.value, expected.value)
+    assert par.unit == expected.unit
+
+
 def test_priorparameter_repr():
     par = PriorParameter("spam", 42, "deg")
     assert repr(par).startswith("PriorParameter(name=")
@@ -86,3 +86,19 @@ def get_fit_statistics_compiled(backend=None):
         backend = COMPILATION_BACKEND_DEFAULT
     backend = CompilationBackendEnum.from_str(backend)
     return COMPILED_STATS_MODULES[backend]()
+
+
+def get_angular_separation_compiled(backend=None):
+    """Get the compiled angular separation, None if the backend does not provide one."""
+    if backend is None:
+        from gammapy.utils.compilation import COMPILATION_BACKEND_DEFAULT
+
+        backend = COMPILATION_BACKEND_DEFAULT
+    backend = CompilationBackendEnum.from_str(backend)
+
+    if backend == CompilationBackendEnum.jit:
+        from gammapy.data.event_list_jit import angular_separation_jit
+
+        return angular_separation_jit
+
+    return None
@@ -48,6 +48,31 @@ class HDULocation:
         except AttributeError:
             return f"<pre>{html.escape(str(self))}</pre>"
 
+    def copy(self, **kwargs):
+        """Copy `HDULocation` instance and overwrite given attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Keyword arguments to overwrite in the HDU location constructor.
+
+        Returns
+        -------
+        copy : `HDULocation`
+            Copied HDU location.
+        """
+        init_kwargs = dict(
+            hdu_class=self.hdu_class,
+            base_dir=self.base_dir,
+            file_dir=self.file_dir,
+            file_name=self.file_name,
+            hdu_name=self.hdu_name,
+            cache=self.cache,
+            format=self.format,
+        )
+        init_kwargs.update(kwargs)
+        return self.__class__(**init_kwargs)
+
     def info(self, file=None):
         """Print some summary information to stdout."""
         if not file:
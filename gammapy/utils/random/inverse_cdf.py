@@ -54,18 +54,22 @@ class InverseCDFSampler:
             Coordinates of the drawn sample.
         """
         choices = self.random_state.uniform(high=1, size=len(self.cdf))
-        shape_cdf = self.cdf.shape
+        n_rows, n_bins = self.cdf.shape
 
-        cdf_all = np.insert(self.cdf, 0, 0, axis=1)
-        edges = np.arange(shape_cdf[1] + 1) - 0.5
+        # linear interpolation of the pixel edges on all rows at once, the
+        # lower node is the last CDF value below the choice as in `np.interp`,
+        # with an implicit leading CDF value of zero
+        idx = np.sum(self.cdf <= choices[:, np.newaxis], axis=1)
+        idx = np.minimum(idx, n_bins - 1)
 
-        pix_coords = []
+        rows = np.arange(n_rows)
+        cdf_hi = self.cdf[rows, idx]
+        cdf_lo = np.where(idx > 0, self.cdf[rows, idx - 1], 0)
 
-        for cdf, choice in zip(cdf_all, choices):
-            pix = np.interp(choice, cdf, edges)
-            pix_coords.append(pix)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pix = 1.0 / (cdf_hi - cdf_lo) * (choices - cdf_lo) + (idx - 0.5)
 
-        return np.array(pix_coords)
+        return np.where(choices >= self.cdf[:, -1], n_bins - 0.5, pix)
 
     def sample(self, size):
         """Draw sample from the given PDF.
@@ -4,7 +4,11 @@ import numpy as np
 from numpy.testing import assert_allclose
 from astropy.io import fits
 from astropy.table import Column, Table
-from gammapy.utils.fits import earth_location_from_dict, earth_location_to_dict
+from gammapy.utils.fits import (
+    HDULocation,
+    earth_location_from_dict,
+    earth_location_to_dict,
+)
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import requires_data
 
@@ -73,3 +77,16 @@ def test_earth_location_to_dict(header):
     assert_allclose(loc_dict["GEOLON"], 16.50022, rtol=1e-4)
     assert_allclose(loc_dict["GEOLAT"], -23.271777, rtol=1e-4)
     assert_allclose(loc_dict["ALTITUDE"], 1834.999999, rtol=1e-4)
+
+
+def test_hdu_location_copy():
+    location = HDULocation(
+        hdu_class="events", file_dir="data", file_name="run.fits", hdu_name="EVENTS"
+    )
+    pointing = location.copy(hdu_class="pointing")
+
+    assert pointing is not location
+    assert pointing.hdu_class == "pointing"
+    assert pointing.file_name == "run.fits"
+    assert pointing.hdu_name == "EVENTS"
+    assert location.hdu_class == "events"